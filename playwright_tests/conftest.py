@@ -1,16 +1,30 @@
 """
 Simple Pytest configuration for Playwright tests.
 Uses a SINGLE browser for all tests.
-Clears cache only after navigating to our app.
+Each test gets a fresh context, so no storage has to be cleared between tests.
 """
 
 import pytest
 import os
+import re
+import json
+import uuid
+import shutil
+import itertools
+import time
+import hashlib
 import logging
+import mimetypes
+import subprocess
 from datetime import datetime
+from urllib.parse import urlparse
 from playwright.sync_api import sync_playwright
 from constants.config import Config
 from constants.urls import URLs
+from constants.test_data import TestData
+from pages.base_page import BasePage
+from utils.screenshot import ScreenshotHelper
+from utils.helpers import SEP
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -18,16 +32,42 @@ logger = logging.getLogger(__name__)
 # Global browser instances
 _playwright = None
 _browser = None
-_context = None
-_page = None
+
+# Static assets served from the on-disk cache
+STATIC_ASSETS = "**/*.{css,js,png,jpg,svg,woff2,gif,webp}"
+_asset_cache_dir = None
+# In-process copy of assets already served this session: url -> (body, content type)
+_asset_memory = {}
+
+# Third-party analytics/tracking/font hosts the tests never need
+BLOCKED_HOSTS = re.compile(
+    r"https?://[^/]*(google-analytics\.com|googletagmanager\.com|fonts\.googleapis\.com"
+    r"|fonts\.gstatic\.com|cdn\.segment\.(com|io)|hotjar\.(com|io)|doubleclick\.net)/"
+)
+
+# Images, fonts and media, matched by extension so API calls are never routed
+MEDIA_ASSETS = re.compile(r"\.(png|jpe?g|gif|webp|avif|ico|woff2?|ttf|otf|eot|mp4|webm|mp3|ogg|wav)(\?.*)?$")
+
+# Turns off CSS transitions/animations so modals and class swaps settle at once
+NO_ANIMATIONS_JS = """
+window.addEventListener('DOMContentLoaded', () => {
+    const style = document.createElement('style');
+    style.textContent = '*, *::before, *::after { transition: none !important; animation: none !important; }';
+    document.head.appendChild(style);
+});
+"""
+
+# Saved storage state (cookies + localStorage) of a logged-in primary user,
+# one file per xdist worker so parallel workers never overwrite each other
+AUTH_STATE_PATH = "auth-{worker_id}.json"
 
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_browser():
     """Setup browser once for entire session."""
-    global _playwright, _browser, _context, _page
+    global _playwright, _browser
     
-    logger.info("=" * 60)
+    logger.info(SEP)
     logger.info("OPENING BROWSER...")
     
     _playwright = sync_playwright().start()
@@ -36,52 +76,464 @@ def setup_browser():
         slow_mo=Config.Browser.SLOW_MO,
         args=['--start-maximized']
     )
-    _context = _browser.new_context(viewport=None, no_viewport=True)
-    _page = _context.new_page()
-    _page.set_default_timeout(30000)
-    
-    # Clear cookies first (this works without being on a page)
-    _context.clear_cookies()
-    
-    # Navigate to our app and then clear localStorage/sessionStorage
-    logger.info(f"Navigating to app: {URLs.BASE_URL}")
-    _page.goto(f"{URLs.BASE_URL}/views/signup.html")
-    
-    # Now we can clear localStorage and sessionStorage
-    _page.evaluate("localStorage.clear(); sessionStorage.clear();")
     
-    logger.info("✅ Browser ready, all cache cleared!")
-    logger.info("=" * 60)
+    logger.info("✅ Browser ready!")
+    logger.info(SEP)
     
     yield
     
     # Cleanup
-    logger.info("=" * 60)
+    logger.info(SEP)
     logger.info("CLOSING BROWSER...")
-    _page.close()
-    _context.close()
     _browser.close()
     _playwright.stop()
     logger.info("✅ Browser closed")
-    logger.info("=" * 60)
+    logger.info(SEP)
+
+
+def _app_version():
+    """Version key for the asset cache: APP_VERSION, else the git hash."""
+    if Config.Cache.APP_VERSION:
+        return Config.Cache.APP_VERSION
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except Exception:
+        return "dev"
+
+
+def _serve_cached_asset(route):
+    """Serve a static asset from memory or disk, fetching and storing it on a miss."""
+    request = route.request
+    if request.method != "GET":
+        route.continue_()
+        return
+    
+    url = request.url
+    cached = _asset_memory.get(url)
+    if cached:
+        route.fulfill(body=cached[0], content_type=cached[1])
+        return
+    
+    ext = os.path.splitext(urlparse(url).path)[1]
+    path = os.path.join(_asset_cache_dir, hashlib.md5(url.encode()).hexdigest() + ext)
+    content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            body = f.read()
+        _asset_memory[url] = (body, content_type)
+        route.fulfill(body=body, content_type=content_type)
+        return
+    
+    try:
+        response = route.fetch()
+    except Exception:
+        route.continue_()
+        return
+    if response.ok:
+        body = response.body()
+        with open(path, "wb") as f:
+            f.write(body)
+        _asset_memory[url] = (body, content_type)
+    route.fulfill(response=response)
+
+
+def _enable_asset_cache(context):
+    """Route static asset requests of a context through the disk cache."""
+    if _asset_cache_dir:
+        context.route(STATIC_ASSETS, _serve_cached_asset)
+
+
+def _block_third_party(context):
+    """Abort requests to analytics, tracking and web-font hosts."""
+    context.route(BLOCKED_HOSTS, lambda route: route.abort())
+
+
+def _block_media(context):
+    """Abort image, font and media requests of a context.
+    
+    Register it after any other route that matches these URLs (asset cache,
+    HAR replay), since the most recently added route is tried first.
+    """
+    if Config.Network.BLOCK_MEDIA:
+        context.route(MEDIA_ASSETS, lambda route: route.abort())
+
+
+def _disable_animations(context):
+    """Inject the no-animation stylesheet into every page of a context."""
+    context.add_init_script(NO_ANIMATIONS_JS)
+
+
+def _apply_timeouts(context):
+    """Bound actions and navigations of a context by the configured timeouts."""
+    context.set_default_timeout(Config.Timeouts.DEFAULT)
+    context.set_default_navigation_timeout(Config.Timeouts.NAVIGATION)
+
+
+def _start_tracing(context):
+    """Start trace recording on a context when traces are kept for failures."""
+    if Config.Trace.ON_FAILURE:
+        context.tracing.start(screenshots=True, snapshots=True, sources=True)
+
+
+def _new_context(replay_har=None, **kwargs):
+    """
+    Open a context on the session browser with the suite's standard setup.
+    
+    Every context gets third-party and media blocking, the no-animation
+    stylesheet and the configured timeouts. Static assets come from the
+    asset cache (or from replay_har), and tracing is started when enabled.
+    A context recording a HAR skips the cache and tracing so the HAR holds
+    real responses.
+    
+    Args:
+        replay_har: HAR file to serve BASE_URL traffic from instead of the asset cache
+        **kwargs: Extra browser.new_context() options (storage_state, record_har_path, ...)
+        
+    Returns:
+        The new BrowserContext
+    """
+    kwargs.setdefault("viewport", None)
+    kwargs.setdefault("no_viewport", True)
+    recording = "record_har_path" in kwargs
+    context = _browser.new_context(**kwargs)
+    
+    # The most recently added route is tried first, so blocking is registered
+    # after the cache / HAR routes to take precedence over them
+    if replay_har:
+        context.route_from_har(replay_har, url=f"{URLs.BASE_URL}/**", not_found="fallback")
+    elif not recording:
+        _enable_asset_cache(context)
+    _block_third_party(context)
+    _block_media(context)
+    _disable_animations(context)
+    _apply_timeouts(context)
+    if not recording:
+        _start_tracing(context)
+    return context
+
+
+def _save_trace_chunk(page, name=None):
+    """End the current trace chunk, saving it only when a name is given."""
+    try:
+        if name:
+            os.makedirs(Config.Trace.DIRECTORY, exist_ok=True)
+            path = os.path.join(Config.Trace.DIRECTORY, f"{name}.zip")
+            page.context.tracing.stop_chunk(path=path)
+            logger.info(f"🧵 Trace: {path}")
+        else:
+            page.context.tracing.stop_chunk()
+        page.context.tracing.start_chunk()
+    except Exception as e:
+        logger.warning(f"⚠️ Could not save trace chunk: {e}")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def asset_cache(setup_browser):
+    """Set up the on-disk static asset cache used by every test context."""
+    global _asset_cache_dir
+    if not Config.Cache.STATIC_ENABLED:
+        yield
+        return
+    
+    # One sub-directory per app version; stale versions are dropped
+    version = _app_version()
+    root = Config.Cache.STATIC_DIR
+    if os.path.isdir(root):
+        for entry in os.listdir(root):
+            if entry != version:
+                shutil.rmtree(os.path.join(root, entry), ignore_errors=True)
+    _asset_cache_dir = os.path.join(root, version)
+    os.makedirs(_asset_cache_dir, exist_ok=True)
+    
+    logger.info(f"Static asset cache: {_asset_cache_dir}")
+    yield
 
 
 @pytest.fixture(scope="function")
 def page():
-    """Provide the page for each test, resetting state."""
-    global _context, _page
+    """Provide a logged-out page in a fresh context for each test.
     
-    # Navigate to signup page first (to ensure we're on our domain)
-    _page.goto(f"{URLs.BASE_URL}/views/signup.html")
+    A new context on the session browser starts with empty storage, so
+    there is nothing to clear and no extra page load per test.
+    """
+    context = _new_context()
+    page = context.new_page()
     
-    # Now clear storage
-    _page.evaluate("localStorage.clear(); sessionStorage.clear();")
-    _context.clear_cookies()
+    yield page
     
-    # Reload to apply cleared state
-    _page.reload()
+    context.close()
+
+
+@pytest.fixture(scope="session")
+def browser(setup_browser):
+    """Expose the shared browser.
     
-    yield _page
+    Open contexts with context_factory instead of browser.new_context(), so
+    they get the configured timeouts, request routing and tracing.
+    """
+    return _browser
+
+
+@pytest.fixture(scope="session")
+def context_factory(setup_browser):
+    """Expose _new_context so test modules open contexts with the suite's standard setup."""
+    return _new_context
+
+
+@pytest.fixture(scope="session")
+def primary_user():
+    """The primary test user's data, checked once for usable credentials."""
+    user = TestData.Users.PRIMARY_USER
+    missing = [key for key in ('username', 'password') if not user.get(key)]
+    if missing:
+        pytest.fail(f"PRIMARY_USER is missing {', '.join(missing)}")
+    return user
+
+
+@pytest.fixture(scope="session")
+def ensure_primary_user(setup_browser, primary_user):
+    """Make sure the primary test user exists on the backend (signup via API)."""
+    user = primary_user
+    request_context = _playwright.request.new_context()
+    try:
+        response = request_context.post(URLs.API.register(), data={
+            'name': user['name'],
+            'username': user['username'],
+            'email': user['email'],
+            'password': user['password']
+        })
+        if response.ok:
+            logger.info(f"✅ Created primary user: {user['username']}")
+        elif response.status == 409:
+            logger.info(f"Primary user already exists: {user['username']}")
+        else:
+            logger.warning(f"⚠️ Could not create primary user ({response.status})")
+    except Exception as e:
+        logger.warning(f"⚠️ Signup API unavailable: {e}")
+    finally:
+        request_context.dispose()
+    return user
+
+
+@pytest.fixture(scope="session")
+def auth_token(setup_browser, ensure_primary_user):
+    """Log the primary user in through the API once and return the token."""
+    user = ensure_primary_user
+    request_context = _playwright.request.new_context()
+    try:
+        response = request_context.post(
+            URLs.API.login(),
+            data={"username": user['username'], "password": user['password']}
+        )
+        token = response.json()["token"] if response.ok else None
+    except Exception:
+        token = None
+    finally:
+        request_context.dispose()
+    
+    if not token:
+        pytest.skip("Login failed - cannot obtain API token")
+    return token
+
+
+@pytest.fixture(scope="session")
+def auth_state_path(auth_token, worker_id):
+    """Write a storage state holding the primary user's API token, once per worker.
+    
+    The app keeps its session in localStorage, so the state is written
+    directly instead of loading a page to let the browser record it.
+    """
+    path = AUTH_STATE_PATH.format(worker_id=worker_id)
+    base = urlparse(URLs.BASE_URL)
+    state = {
+        "cookies": [],
+        "origins": [{
+            "origin": f"{base.scheme}://{base.netloc}",
+            "localStorage": [{"name": "token", "value": auth_token}]
+        }]
+    }
+    with open(path, "w") as f:
+        json.dump(state, f)
+    
+    logger.info(f"✅ Auth state saved: {path}")
+    return path
+
+
+@pytest.fixture(scope="function")
+def token_page(auth_token):
+    """Provide a page in a fresh context whose localStorage is seeded with the API token.
+    
+    The token is only seeded on the first load of the tab, so a logout
+    within the test stays logged out.
+    """
+    context = _new_context()
+    context.add_init_script(f"""
+        if (!sessionStorage.getItem('tokenSeeded')) {{
+            localStorage.setItem('token', {json.dumps(auth_token)});
+            sessionStorage.setItem('tokenSeeded', '1');
+        }}
+    """)
+    page = context.new_page()
+    
+    yield page
+    
+    context.close()
+
+
+@pytest.fixture(scope="session")
+def shared_context(auth_state_path):
+    """One long-lived context logged in as the primary user, reused by all authed tests."""
+    context = _new_context(storage_state=auth_state_path)
+    
+    yield context
+    
+    context.close()
+
+
+@pytest.fixture(scope="function")
+def authed_page(shared_context):
+    """Provide a fresh page in the shared logged-in context."""
+    page = shared_context.new_page()
+    
+    yield page
+    
+    page.close()
+
+
+@pytest.fixture(scope="function")
+def isolated_page(auth_state_path):
+    """Provide a logged-in page in its own context, for tests that mutate session state."""
+    context = _new_context(storage_state=auth_state_path)
+    page = context.new_page()
+    
+    yield page
+    
+    context.close()
+
+
+@pytest.fixture(scope="class")
+def class_context(auth_state_path):
+    """One logged-in context shared by the tests of a single class."""
+    context = _new_context(storage_state=auth_state_path)
+    
+    yield context
+    
+    context.close()
+
+
+@pytest.fixture(scope="function")
+def class_page(class_context):
+    """Provide a fresh page in the class-scoped logged-in context."""
+    page = class_context.new_page()
+    
+    yield page
+    
+    page.close()
+
+
+@pytest.fixture(scope="session")
+def navigation_har(auth_state_path, tmp_path_factory):
+    """Record the app's pages and static assets to a HAR once per session (per worker).
+    
+    Only BASE_URL traffic is recorded, so API calls always stay live.
+    """
+    har_path = str(tmp_path_factory.mktemp("har") / "navigation.har")
+    context = _new_context(
+        storage_state=auth_state_path,
+        record_har_path=har_path,
+        record_har_url_filter=f"{URLs.BASE_URL}/**"
+    )
+    page = context.new_page()
+    
+    try:
+        for url in (URLs.Pages.home(), URLs.Pages.profile(), URLs.Pages.friends(),
+                    URLs.Pages.explore(), URLs.Pages.notifications()):
+            page.goto(url, wait_until="load")
+    except Exception as e:
+        logger.warning(f"⚠️ Could not record navigation HAR: {e}")
+        har_path = None
+    finally:
+        # The HAR file is written when the context closes
+        context.close()
+    
+    return har_path
+
+
+@pytest.fixture(scope="class")
+def har_context(auth_state_path, navigation_har):
+    """Logged-in context that replays pages and assets from the navigation HAR."""
+    context = _new_context(replay_har=navigation_har, storage_state=auth_state_path)
+    
+    yield context
+    
+    context.close()
+
+
+@pytest.fixture(scope="function")
+def har_page(har_context):
+    """Provide a fresh page in the HAR-replaying context."""
+    page = har_context.new_page()
+    
+    yield page
+    
+    page.close()
+
+
+@pytest.fixture(scope="function")
+def seeded_post(auth_token):
+    """Create a post for the primary user through the API and delete it afterwards.
+    
+    Yields:
+        Content of the seeded post
+    """
+    content = f"seed-{uuid.uuid4().hex[:12]}"
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    request_context = _playwright.request.new_context()
+    
+    try:
+        response = request_context.post(URLs.API.create_post(), headers=headers, data={"content": content})
+        ok = response.ok
+        body = response.json() if ok else {}
+    except Exception:
+        ok, body = False, {}
+    if not ok:
+        request_context.dispose()
+        pytest.skip("Could not seed a post through the API")
+    
+    post = body.get("post", body) if isinstance(body, dict) else {}
+    post_id = post.get("_id") or post.get("id")
+    
+    yield content
+    
+    if post_id:
+        try:
+            request_context.delete(URLs.API.delete_post(post_id), headers=headers)
+        except Exception:
+            pass
+    request_context.dispose()
+
+
+@pytest.fixture(scope="session")
+def uid_gen():
+    """Return a callable yielding ids unique across xdist workers and reruns."""
+    # The pid separates concurrent workers, the millisecond clock separates runs
+    base = os.getpid() * 10**7 + int(time.time() * 1000) % 10**6
+    return itertools.count(base).__next__
+
+
+@pytest.fixture(scope="session")
+def user_pool(uid_gen):
+    """Signup users generated once per session (per xdist worker)."""
+    return [TestData.generate_random_user(unique_id=uid_gen()) for _ in range(50)]
+
+
+@pytest.fixture(scope="function")
+def fresh_user(user_pool, uid_gen):
+    """Provide a unique user from the session pool."""
+    return user_pool.pop() if user_pool else TestData.generate_random_user(unique_id=uid_gen())
 
 
 @pytest.fixture(scope="session")
@@ -93,18 +545,37 @@ def base_url():
 # Screenshot on failure
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    """Take screenshot on failure."""
+    """Take screenshot and keep the trace on failure."""
     outcome = yield
     report = outcome.get_result()
     
-    if report.when == "call" and report.failed:
-        global _page
-        if _page and Config.Screenshot.ON_FAILURE:
+    if report.when != "call":
+        return
+    
+    # Every page fixture runs in its own context
+    target = (
+        item.funcargs.get("page") or
+        item.funcargs.get("authed_page") or
+        item.funcargs.get("class_page") or
+        item.funcargs.get("har_page") or
+        item.funcargs.get("isolated_page") or
+        item.funcargs.get("token_page") or
+        item.funcargs.get("anonymous_page") or
+        # Page-object fixtures (e.g. class-scoped ones) carry their page
+        next((v.page for v in item.funcargs.values() if isinstance(v, BasePage)), None)
+    )
+    
+    # Traces are recorded per test chunk and only written out for failures
+    if target and Config.Trace.ON_FAILURE:
+        _save_trace_chunk(target, item.name if report.failed else None)
+    
+    if report.failed:
+        if target and Config.Screenshot.ON_FAILURE:
             os.makedirs(Config.Screenshot.DIRECTORY, exist_ok=True)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            path = os.path.join(Config.Screenshot.DIRECTORY, f"{item.name}_{timestamp}.png")
+            path = os.path.join(Config.Screenshot.DIRECTORY, f"{item.name}_{timestamp}.{Config.Screenshot.FORMAT}")
             try:
-                _page.screenshot(path=path, full_page=True)
+                target.screenshot(path=path, full_page=True, **ScreenshotHelper.image_options())
                 logger.info(f"📸 Screenshot: {path}")
             except:
                 pass
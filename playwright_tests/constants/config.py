@@ -45,11 +45,11 @@ class Config:
     class Timeouts:
         """Timeout configurations in milliseconds."""
         
-        # Default timeout for all operations
-        DEFAULT = int(os.getenv('DEFAULT_TIMEOUT', '30000'))  # 30 seconds
+        # Default timeout for all operations (fail fast; pass timeout= for slow steps)
+        DEFAULT = int(os.getenv('DEFAULT_TIMEOUT', '5000'))  # 5 seconds
         
         # Navigation timeout
-        NAVIGATION = int(os.getenv('NAVIGATION_TIMEOUT', '30000'))  # 30 seconds
+        NAVIGATION = int(os.getenv('NAVIGATION_TIMEOUT', '10000'))  # 10 seconds
         
         # Element wait timeout
         ELEMENT_WAIT = int(os.getenv('ELEMENT_WAIT_TIMEOUT', '10000'))  # 10 seconds
@@ -76,14 +76,14 @@ class Config:
         # Screenshot directory
         DIRECTORY = os.getenv('SCREENSHOT_DIR', 'screenshots')
         
-        # Screenshot format (png, jpeg)
-        FORMAT = os.getenv('SCREENSHOT_FORMAT', 'png')
+        # Screenshot format (png, jpeg); jpeg encodes much faster and smaller
+        FORMAT = os.getenv('SCREENSHOT_FORMAT', 'jpeg')
         
-        # Full page screenshot
-        FULL_PAGE = os.getenv('SCREENSHOT_FULL_PAGE', 'True').lower() == 'true'
+        # Full page screenshot (failure screenshots are always full page)
+        FULL_PAGE = os.getenv('SCREENSHOT_FULL_PAGE', 'False').lower() == 'true'
         
         # Screenshot quality (0-100 for jpeg)
-        QUALITY = int(os.getenv('SCREENSHOT_QUALITY', '90'))
+        QUALITY = int(os.getenv('SCREENSHOT_QUALITY', '60'))
     
     # ==================== VIDEO SETTINGS ====================
     class Video:
@@ -102,6 +102,36 @@ class Config:
         # Retain video on success
         RETAIN_ON_SUCCESS = os.getenv('VIDEO_RETAIN_ON_SUCCESS', 'False').lower() == 'true'
     
+    # ==================== TRACE SETTINGS ====================
+    class Trace:
+        """Playwright trace recording configuration."""
+        
+        # Record traces and keep them only for failed tests (off by default; enable in CI)
+        ON_FAILURE = os.getenv('TRACE_ON_FAILURE', 'False').lower() == 'true'
+        
+        # Trace directory
+        DIRECTORY = os.getenv('TRACE_DIR', 'traces')
+    
+    # ==================== STATIC ASSET CACHE ====================
+    class Cache:
+        """On-disk cache for static assets served through page routes."""
+        
+        # Serve css/js/images/fonts from disk after the first fetch
+        STATIC_ENABLED = os.getenv('STATIC_CACHE', 'True').lower() == 'true'
+        
+        # Cache directory
+        STATIC_DIR = os.getenv('STATIC_CACHE_DIR', '.cache_static')
+        
+        # App version the cache belongs to (defaults to the current git hash)
+        APP_VERSION = os.getenv('APP_VERSION', '')
+    
+    # ==================== NETWORK SETTINGS ====================
+    class Network:
+        """Request blocking for test browser contexts."""
+        
+        # Abort image, font and media requests (no test asserts on them)
+        BLOCK_MEDIA = os.getenv('BLOCK_MEDIA', 'True').lower() == 'true'
+    
     # ==================== TEST EXECUTION SETTINGS ====================
     class Execution:
         """Test execution configuration."""
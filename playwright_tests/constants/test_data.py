@@ -4,6 +4,7 @@ Contains user credentials, sample content, and test scenarios.
 """
 
 from faker import Faker
+import os
 import random
 import string
 
@@ -172,9 +173,20 @@ class TestData:
     
     # ==================== HELPER METHODS ====================
     @staticmethod
-    def generate_random_user():
-        """Generate a random user for testing."""
-        username = fake.user_name() + str(random.randint(1000, 9999))
+    def generate_random_user(unique_id: int = None):
+        """
+        Generate a random user for testing.
+        
+        Args:
+            unique_id: Id that makes the username unique (e.g. from the uid_gen fixture);
+                falls back to the worker id plus a random suffix
+        """
+        if unique_id is not None:
+            username = f"pwuser{unique_id}"
+        else:
+            # Include the xdist worker id so parallel workers never collide on the backend
+            worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+            username = fake.user_name() + worker + str(random.randint(1000, 9999))
         return {
             'name': fake.name(),
             'username': username,
@@ -22,19 +22,42 @@ class BasePage:
         """
         self.page = page
         self.timeout = Config.Timeouts.DEFAULT
+        # Selector -> Locator cache, filled on first use by _loc()
+        self._locs = {}
+    
+    def _loc(self, selector: str):
+        """
+        Get the cached locator for a selector, creating it on first use.
+        
+        The locator targets the first match, like the page.* selector calls,
+        so selectors matching several elements don't trip strict mode.
+        
+        Args:
+            selector: CSS selector
+            
+        Returns:
+            Locator for the first element matching the selector
+        """
+        loc = self._locs.get(selector)
+        if loc is None:
+            loc = self._locs[selector] = self.page.locator(selector).first
+        return loc
     
     # ==================== NAVIGATION ====================
     
-    def navigate(self, url: str):
+    def navigate(self, url: str, wait_until: str = "domcontentloaded"):
         """
         Navigate to a URL.
         
+        Returns once the DOM is parsed; content rendered from API calls
+        should be waited for explicitly (e.g. a page's wait_for_*_loaded).
+        
         Args:
             url: URL to navigate to
+            wait_until: Load state to wait for (domcontentloaded, load, networkidle)
         """
         logger.info(f"Navigating to: {url}")
-        self.page.goto(url, timeout=Config.Timeouts.NAVIGATION)
-        self.wait_for_page_load()
+        self.page.goto(url, wait_until=wait_until, timeout=Config.Timeouts.NAVIGATION)
     
     def wait_for_page_load(self):
         """Wait for page to be fully loaded."""
@@ -63,7 +86,7 @@ class BasePage:
         """
         timeout = timeout or self.timeout
         logger.debug(f"Clicking element: {selector}")
-        self.page.click(selector, timeout=timeout)
+        self._loc(selector).click(timeout=timeout)
     
     def fill(self, selector: str, text: str, timeout: int = None):
         """
@@ -76,7 +99,31 @@ class BasePage:
         """
         timeout = timeout or self.timeout
         logger.debug(f"Filling '{selector}' with: {text}")
-        self.page.fill(selector, text, timeout=timeout)
+        self._loc(selector).fill(text, timeout=timeout)
+    
+    def bulk_fill(self, values: dict):
+        """
+        Fill several inputs in a single page evaluation.
+        
+        Sets each value directly and dispatches input/change events so page
+        listeners still run. Missing elements are skipped.
+        
+        Args:
+            values: Mapping of CSS selector to text
+        """
+        logger.debug(f"Bulk filling {len(values)} fields")
+        self.page.evaluate(
+            """values => {
+                for (const [selector, text] of Object.entries(values)) {
+                    const el = document.querySelector(selector);
+                    if (!el) continue;
+                    el.value = text;
+                    el.dispatchEvent(new Event('input', { bubbles: true }));
+                    el.dispatchEvent(new Event('change', { bubbles: true }));
+                }
+            }""",
+            values
+        )
     
     def type_text(self, selector: str, text: str, delay: int = 50):
         """
@@ -137,11 +184,30 @@ class BasePage:
         """
         timeout = timeout or Config.Timeouts.ELEMENT_WAIT
         try:
-            self.page.wait_for_selector(selector, state="visible", timeout=timeout)
+            self._loc(selector).wait_for(state="visible", timeout=timeout)
             return True
         except Exception:
             return False
     
+    def check_visible(self, selectors: dict) -> dict:
+        """
+        Check visibility of several elements in a single page evaluation.
+        
+        Args:
+            selectors: Mapping of name to CSS selector
+            
+        Returns:
+            Mapping of name to True if the element exists and is rendered
+        """
+        # getClientRects() also counts fixed-position elements, whose offsetParent is null
+        return self.page.evaluate(
+            """sels => Object.fromEntries(Object.entries(sels).map(([name, sel]) => {
+                const el = document.querySelector(sel);
+                return [name, !!el && !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)];
+            }))""",
+            selectors
+        )
+    
     def is_hidden(self, selector: str, timeout: int = None) -> bool:
         """
         Check if element is hidden.
@@ -199,11 +265,11 @@ class BasePage:
         Returns:
             Attribute value
         """
-        return self.page.get_attribute(selector, attribute) or ""
+        return self._loc(selector).get_attribute(attribute) or ""
     
     def get_value(self, selector: str) -> str:
         """Get value of input element."""
-        return self.page.input_value(selector)
+        return self._loc(selector).input_value()
     
     def count_elements(self, selector: str) -> int:
         """
@@ -320,7 +386,7 @@ class BasePage:
     
     def get_local_storage(self, key: str) -> str:
         """Get item from local storage."""
-        return self.execute_script(f"return localStorage.getItem('{key}')")
+        return self.execute_script("key => localStorage.getItem(key)", key)
     
     def set_local_storage(self, key: str, value: str):
         """Set item in local storage."""
@@ -3,7 +3,7 @@ Explore Page Object.
 Handles all interactions with the explore/search page for user discovery.
 """
 
-from playwright.sync_api import Page
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 from .base_page import BasePage
 from constants.selectors import Selectors
 from constants.urls import URLs
@@ -178,6 +178,27 @@ class ExplorePage(BasePage):
                 return "none"
         return "unknown"
     
+    def get_all_friendship_statuses(self) -> list:
+        """Get friendship status for every user card in a single round-trip.
+        
+        Uses the same rules as get_friendship_status().
+        
+        Returns:
+            List of "friends", "sent", "received", "none" or "unknown", one per card
+        """
+        return self.page.evaluate("""() => {
+            const buttonText = (card, label) =>
+                Array.from(card.querySelectorAll('button')).some(b => b.textContent.includes(label));
+            const cards = document.querySelectorAll('.user-card, #searchResults .card, #usersContainer .card');
+            return Array.from(cards).map(card => {
+                if (card.querySelector('.friends-badge, .remove-friend-btn') || buttonText(card, 'Friends')) return 'friends';
+                if (card.querySelector('.cancel-request-btn') || buttonText(card, 'Cancel') || buttonText(card, 'Pending')) return 'sent';
+                if (card.querySelector('.accept-btn') || buttonText(card, 'Accept')) return 'received';
+                if (card.querySelector('.add-friend-btn') || buttonText(card, 'Add Friend')) return 'none';
+                return 'unknown';
+            });
+        }""")
+    
     # ==================== DISCOVER SECTION ====================
     def is_discover_section_visible(self):
         """Check if discover/suggestions section is visible."""
@@ -187,6 +208,24 @@ class ExplorePage(BasePage):
         """Get number of users in discover section."""
         return self.count_elements("#usersContainer .card, .discover-user-card")
     
+    def wait_for_discover_loaded(self, timeout: int = 5000):
+        """Wait until discover user cards or the empty state are rendered.
+        
+        Returns:
+            True if the section settled within timeout, False otherwise
+        """
+        try:
+            self.page.wait_for_function(
+                """() =>
+                    document.querySelectorAll('#usersContainer .card, .discover-user-card, .user-card').length > 0 ||
+                    document.querySelector('.empty-users, .no-results-message, .empty-state') !== null""",
+                timeout=timeout
+            )
+            return True
+        except PlaywrightTimeoutError:
+            logger.info(f"Discover section did not load within {timeout}ms")
+            return False
+    
     def get_discover_usernames(self):
         """Get usernames from discover section."""
         users = self.page.locator("#usersContainer .card .card-subtitle, .discover-user-card .username")
@@ -3,7 +3,7 @@ Friends Page Object.
 Handles all interactions with the friends page including friend list, requests, and suggestions.
 """
 
-from playwright.sync_api import Page
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 from .base_page import BasePage
 from constants.selectors import Selectors
 from constants.urls import URLs
@@ -270,6 +270,24 @@ class FriendsPage(BasePage):
             self.is_visible("#friendsContainer")
         )
     
+    def wait_for_friends_list_loaded(self, timeout: int = 5000):
+        """Wait until friend cards or the empty state are rendered.
+        
+        Returns:
+            True if the list settled within timeout, False otherwise
+        """
+        try:
+            self.page.wait_for_function(
+                """() =>
+                    document.querySelectorAll('.friend-card, .friend-item, #friendsContainer .card').length > 0 ||
+                    document.querySelector('.empty-friends, .no-friends-message, .empty-state') !== null""",
+                timeout=timeout
+            )
+            return True
+        except PlaywrightTimeoutError:
+            logger.info(f"Friends list did not load within {timeout}ms")
+            return False
+    
     def wait_for_page_load(self):
         """Wait for friends page to load completely."""
         self.page.wait_for_load_state("networkidle")
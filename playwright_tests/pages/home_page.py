@@ -3,7 +3,8 @@ Home/Feed Page Object.
 Handles all interactions with the home feed page including posts, likes, and comments.
 """
 
-from playwright.sync_api import Page
+from functools import cached_property
+from playwright.sync_api import Page, expect, TimeoutError as PlaywrightTimeoutError
 from .base_page import BasePage
 from constants.selectors import Selectors
 from constants.urls import URLs
@@ -30,15 +31,34 @@ class HomePage(BasePage):
         """Check if currently on home page."""
         return "home.html" in self.page.url
     
+    @cached_property
+    def post_input(self):
+        """Locator for the post input that opens the creation modal."""
+        return self.page.locator("#postInput")
+    
+    @cached_property
+    def modal_locator(self):
+        """Locator for the post creation modal."""
+        return self.page.locator("#postModal")
+    
+    @cached_property
+    def comments_modal_locator(self):
+        """Locator for the comments modal."""
+        return self.page.locator("#commentsModal")
+    
     # ==================== POST CREATION ====================
     def is_post_input_visible(self):
         """Check if post input/trigger is visible."""
         return self.is_visible("#postInput") or self.is_visible(self.selectors.CREATE_POST_TEXTAREA)
     
     def click_post_input(self):
-        """Click on post input to open modal."""
-        self.click("#postInput")
-        self.wait_for_timeout(500)
+        """Click on post input to open modal (does not wait for it)."""
+        self.post_input.click()
+    
+    def open_post_modal(self, timeout: int = 3000):
+        """Click the post input and wait for the creation modal to show."""
+        self.post_input.click()
+        self.modal_locator.wait_for(state="visible", timeout=timeout)
     
     def is_post_modal_visible(self):
         """Check if post creation modal is visible."""
@@ -55,9 +75,8 @@ class HomePage(BasePage):
         self.upload_file("#imageInput", image_path)
     
     def click_submit_post(self):
-        """Click submit post button."""
+        """Click submit post button (callers wait for the post to appear)."""
         self.click("#submitPost")
-        self.wait_for_timeout(2000)
     
     def create_post(self, content: str, image_path: str = None):
         """
@@ -69,9 +88,8 @@ class HomePage(BasePage):
         """
         logger.info(f"Creating post: {content[:50]}...")
         
-        # Click on post input to open modal
-        self.click_post_input()
-        self.wait_for_timeout(500)
+        # Open the creation modal
+        self.open_post_modal()
         
         # Enter content
         self.enter_post_content(content)
@@ -83,10 +101,10 @@ class HomePage(BasePage):
         self.click_submit_post()
         self.wait_for_timeout(2000)
     
-    def close_post_modal(self):
-        """Close the post creation modal."""
+    def close_post_modal(self, timeout: int = 3000):
+        """Close the post creation modal and wait for it to hide."""
         self.click("#closeModal")
-        self.wait_for_timeout(300)
+        self.modal_locator.wait_for(state="hidden", timeout=timeout)
     
     # ==================== FEED INTERACTIONS ====================
     def get_post_count(self):
@@ -98,6 +116,44 @@ class HomePage(BasePage):
         self.wait_for_timeout(2000)
         return self.get_post_count() > 0
     
+    def wait_for_feed_loaded(self, timeout: int = 5000):
+        """Wait until post cards or the empty feed state are rendered.
+        
+        Returns:
+            True if the feed settled within timeout, False otherwise
+        """
+        try:
+            self.page.wait_for_function(
+                """sel =>
+                    document.querySelectorAll(sel).length > 0 ||
+                    document.querySelector('.empty-feed, .no-posts-message, .empty-state') !== null""",
+                arg=self.selectors.POST_CARD,
+                timeout=timeout
+            )
+            return True
+        except PlaywrightTimeoutError:
+            logger.info(f"Feed did not load within {timeout}ms")
+            return False
+    
+    def wait_for_post_with_text(self, snippet: str, timeout: int = 5000):
+        """
+        Wait until a post containing the given text is rendered in the feed.
+        
+        Args:
+            snippet: Text the post content should contain
+            timeout: Maximum wait time in milliseconds
+            
+        Returns:
+            True if the post appeared within timeout, False otherwise
+        """
+        post = self.page.locator(".post-content, .post-text").filter(has_text=snippet).first
+        try:
+            expect(post).to_be_visible(timeout=timeout)
+            return True
+        except AssertionError:
+            logger.info(f"Post '{snippet}' did not appear within {timeout}ms")
+            return False
+    
     def get_first_post_content(self):
         """Get content of first post in feed."""
         posts = self.page.locator(self.selectors.POST_CARD)
@@ -113,14 +169,16 @@ class HomePage(BasePage):
         return None
     
     # ==================== LIKE FUNCTIONALITY ====================
+    def post_like_button(self, post_index: int = 0):
+        """Get the like button locator of a post by index."""
+        return self.page.locator(self.selectors.POST_CARD).nth(post_index).locator(self.selectors.LIKE_BUTTON)
+    
     def like_post(self, post_index: int = 0):
-        """Like a post by index."""
+        """Like a post by index (callers wait on the button's class to change)."""
         logger.info(f"Liking post at index {post_index}")
         posts = self.page.locator(self.selectors.POST_CARD)
         if posts.count() > post_index:
-            like_btn = posts.nth(post_index).locator(self.selectors.LIKE_BUTTON)
-            like_btn.click()
-            self.wait_for_timeout(1000)
+            self.post_like_button(post_index).click()
             return True
         return False
     
@@ -162,7 +220,10 @@ class HomePage(BasePage):
         if posts.count() > post_index:
             comment_btn = posts.nth(post_index).locator(self.selectors.COMMENT_BUTTON)
             comment_btn.click()
-            self.wait_for_timeout(500)
+            try:
+                self.comments_modal_locator.wait_for(state="visible", timeout=3000)
+            except PlaywrightTimeoutError:
+                logger.info("Comments modal did not open within 3000ms")
     
     def add_comment(self, post_index: int, comment: str):
         """Add comment to a post."""
@@ -198,12 +259,12 @@ class HomePage(BasePage):
     
     def close_comments_modal(self):
         """Close comments modal."""
-        modal = self.page.locator("#commentsModal")
+        modal = self.comments_modal_locator
         if modal.is_visible():
             close_btn = modal.locator(".btn-close, .close")
             if close_btn.count() > 0:
                 close_btn.first.click()
-                self.wait_for_timeout(300)
+                modal.wait_for(state="hidden", timeout=3000)
     
     # ==================== POST OPTIONS ====================
     def open_post_options(self, post_index: int = 0):
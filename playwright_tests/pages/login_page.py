@@ -4,7 +4,8 @@ Handles all interactions with the login page.
 Updated to match actual HTML structure with Bootstrap toasts.
 """
 
-from playwright.sync_api import Page
+from functools import cached_property
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 from .base_page import BasePage
 from constants.selectors import Selectors
 from constants.urls import URLs
@@ -13,6 +14,11 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Resolves to 'success' once on the home page, 'failed' once the error toast shows
+LOGIN_OUTCOME_JS = """errorToast =>
+    location.pathname.endsWith('home.html') ? 'success' :
+    document.querySelector(errorToast + '.show') ? 'failed' : false"""
+
 
 class LoginPage(BasePage):
     """Login page object for authentication testing."""
@@ -28,6 +34,44 @@ class LoginPage(BasePage):
         self.selectors = Selectors.Login
         self.url = URLs.Pages.login()
     
+    # ==================== LOCATORS ====================
+    # Built once per page object and reused by every action on it
+    
+    @cached_property
+    def username_input(self):
+        """Username input locator."""
+        return self.page.locator(self.selectors.USERNAME_INPUT)
+    
+    @cached_property
+    def password_input(self):
+        """Password input locator."""
+        return self.page.locator(self.selectors.PASSWORD_INPUT)
+    
+    @cached_property
+    def login_button(self):
+        """Login submit button locator."""
+        return self.page.locator(self.selectors.LOGIN_BUTTON)
+    
+    @cached_property
+    def password_toggle(self):
+        """Password visibility toggle locator."""
+        return self.page.locator(self.selectors.TOGGLE_PASSWORD)
+    
+    @cached_property
+    def error_toast(self):
+        """Login failure toast locator."""
+        return self.page.locator(self.selectors.ERROR_TOAST)
+    
+    @cached_property
+    def signup_link(self):
+        """Signup link locator."""
+        return self.page.locator(self.selectors.SIGNUP_LINK)
+    
+    @cached_property
+    def forgot_password_link(self):
+        """Forgot password link locator."""
+        return self.page.locator(self.selectors.FORGOT_PASSWORD_LINK)
+    
     # ==================== NAVIGATION ====================
     
     def navigate(self):
@@ -54,7 +98,7 @@ class LoginPage(BasePage):
             username: Username to enter
         """
         logger.info(f"Entering username: {username}")
-        self.fill(self.selectors.USERNAME_INPUT, username)
+        self.username_input.fill(username)
     
     def enter_password(self, password: str):
         """
@@ -64,12 +108,12 @@ class LoginPage(BasePage):
             password: Password to enter
         """
         logger.info("Entering password")
-        self.fill(self.selectors.PASSWORD_INPUT, password)
+        self.password_input.fill(password)
     
     def click_login_button(self):
         """Click the login button to submit the form."""
         logger.info("Clicking login button")
-        self.click(self.selectors.LOGIN_BUTTON)
+        self.login_button.click()
     
     def click_signup_link(self):
         """Click the 'Sign Up' link to navigate to signup page."""
@@ -84,7 +128,7 @@ class LoginPage(BasePage):
     def toggle_password_visibility(self):
         """Toggle password field visibility."""
         logger.info("Toggling password visibility")
-        self.click(self.selectors.TOGGLE_PASSWORD)
+        self.password_toggle.click()
     
     def login(self, username: str, password: str):
         """
@@ -102,6 +146,34 @@ class LoginPage(BasePage):
         # Wait for either redirect or toast message
         self.wait_for_timeout(2500)
     
+    def login_fast(self, username: str, password: str):
+        """
+        Fill and submit the login form in a single page evaluation.
+        
+        Sets both inputs, dispatches input events and calls requestSubmit()
+        on the form, so the page's submit handler and validation still run.
+        Does not wait for the outcome; callers wait on the redirect or toast.
+        
+        Args:
+            username: Username to login with
+            password: Password to login with
+        """
+        logger.info(f"Fast login with username: {username}")
+        self.page.evaluate(
+            """([form, fields]) => {
+                for (const [selector, text] of Object.entries(fields)) {
+                    const el = document.querySelector(selector);
+                    el.value = text;
+                    el.dispatchEvent(new Event('input', { bubbles: true }));
+                }
+                document.querySelector(form).requestSubmit();
+            }""",
+            [self.selectors.FORM, {
+                self.selectors.USERNAME_INPUT: username,
+                self.selectors.PASSWORD_INPUT: password
+            }]
+        )
+    
     def quick_login(self, username: str, password: str):
         """
         Quick login without page navigation (assumes already on login page).
@@ -114,20 +186,38 @@ class LoginPage(BasePage):
     
     # ==================== VALIDATION METHODS ====================
     
+    def wait_for_login_outcome(self, timeout: int = 10000):
+        """
+        Race the home redirect against the error toast and return the first.
+        
+        Args:
+            timeout: Maximum wait time in milliseconds
+            
+        Returns:
+            'success', 'failed', or None if neither happened within timeout
+        """
+        try:
+            handle = self.page.wait_for_function(
+                LOGIN_OUTCOME_JS, arg=self.selectors.ERROR_TOAST, timeout=timeout
+            )
+            return handle.json_value()
+        except PlaywrightTimeoutError:
+            return None
+    
     def is_login_successful(self) -> bool:
         """
         Check if login was successful by verifying redirect to home page.
         
+        Returns early with False as soon as the error toast appears.
+        
         Returns:
             True if redirected to home page, False otherwise
         """
-        try:
-            self.wait_for_url("**/home.html", timeout=5000)
+        if self.wait_for_login_outcome(timeout=5000) == 'success':
             logger.info("Login successful - redirected to home page")
             return True
-        except Exception:
-            logger.warning("Login failed - not redirected to home page")
-            return False
+        logger.warning("Login failed - not redirected to home page")
+        return False
     
     def is_success_toast_displayed(self) -> bool:
         """
@@ -327,6 +417,23 @@ class LoginPage(BasePage):
         """Check if forgot password link is visible."""
         return self.is_visible(self.selectors.FORGOT_PASSWORD_LINK)
     
+    def check_all_elements_visible(self) -> dict:
+        """
+        Check visibility of all login form elements in one round-trip.
+        
+        Returns:
+            Mapping of element name to visibility
+        """
+        return self.check_visible({
+            'form': self.selectors.FORM,
+            'username': self.selectors.USERNAME_INPUT,
+            'password': self.selectors.PASSWORD_INPUT,
+            'login_button': self.selectors.LOGIN_BUTTON,
+            'password_toggle': self.selectors.TOGGLE_PASSWORD,
+            'signup_link': self.selectors.SIGNUP_LINK,
+            'forgot_password_link': self.selectors.FORGOT_PASSWORD_LINK
+        })
+    
     def are_all_elements_visible(self) -> bool:
         """
         Check if all essential login page elements are visible.
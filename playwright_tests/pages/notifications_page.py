@@ -3,8 +3,10 @@ Notifications Page Object.
 Handles all interactions with the notifications page.
 """
 
-from playwright.sync_api import Page
+from functools import cached_property
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 from .base_page import BasePage
+from constants.config import Config
 from constants.selectors import Selectors
 from constants.urls import URLs
 import logging
@@ -29,6 +31,24 @@ class NotificationsPage(BasePage):
         """Check if currently on notifications page."""
         return "notifications.html" in self.page.url
     
+    def wait_for_notifications_loaded(self, timeout: int = 5000):
+        """Wait until notifications or the empty state are rendered.
+        
+        Returns:
+            True if the list settled within timeout, False otherwise
+        """
+        try:
+            self.page.wait_for_function(
+                """() =>
+                    document.querySelectorAll('.notification-item, .notification-card, #notificationsList .list-group-item').length > 0 ||
+                    document.querySelector('.no-notifications-message, .empty-state') !== null""",
+                timeout=timeout
+            )
+            return True
+        except PlaywrightTimeoutError:
+            logger.info(f"Notifications did not load within {timeout}ms")
+            return False
+    
     # ==================== NOTIFICATIONS LIST ====================
     def get_notifications_count(self):
         """Get total number of notifications."""
@@ -76,6 +96,31 @@ class NotificationsPage(BasePage):
             return "unread" in classes
         return False
     
+    def get_notifications_summary(self) -> dict:
+        """Get all notification counts in a single round-trip.
+        
+        Uses the same selectors as the individual count/visibility methods.
+        
+        Returns:
+            Dict with "total", "unread", "friend_requests" and "empty" keys
+        """
+        return self.page.evaluate("""() => {
+            const count = sel => document.querySelectorAll(sel).length;
+            const isVisible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+            const hasText = (sel, text) => Array.from(document.querySelectorAll(sel))
+                .filter(el => el.textContent.toLowerCase().includes(text));
+            const friendRequests = new Set(hasText('.notification-item', 'friend request')
+                .concat(Array.from(document.querySelectorAll('.friend-request-notification'))));
+            const emptyMessage = Array.from(document.querySelectorAll('.no-notifications-message, .empty-state'))
+                .concat(hasText('p', 'no notifications'));
+            return {
+                total: count('.notification-item, .notification-card, #notificationsList .list-group-item'),
+                unread: count('.notification-item.unread, .notification-card.unread, .list-group-item.unread'),
+                friend_requests: friendRequests.size,
+                empty: emptyMessage.some(isVisible),
+            };
+        }""")
+    
     # ==================== NOTIFICATION ACTIONS ====================
     def click_notification(self, index: int = 0):
         """Click on a notification."""
@@ -135,32 +180,53 @@ class NotificationsPage(BasePage):
         """Get count of friend request notifications."""
         return self.count_elements(".notification-item:has-text('friend request'), .friend-request-notification")
     
+    def all_friend_request_items(self):
+        """Get every friend request notification as a list of locators, read in one query."""
+        return self.page.locator(".notification-item:has-text('friend request'), .friend-request-notification").all()
+    
+    def accept_friend_request_item(self, item):
+        """Accept the friend request of a notification item from all_friend_request_items()."""
+        accept_btn = item.locator(".accept-btn, button:has-text('Accept')")
+        if accept_btn.count() > 0:
+            accept_btn.click()
+            self.wait_for_timeout(1000)
+            return True
+        return False
+    
+    def reject_friend_request_item(self, item):
+        """Reject the friend request of a notification item from all_friend_request_items()."""
+        reject_btn = item.locator(".reject-btn, button:has-text('Reject')")
+        if reject_btn.count() > 0:
+            reject_btn.click()
+            self.wait_for_timeout(1000)
+            return True
+        return False
+    
     def accept_friend_request_from_notification(self, index: int = 0):
         """Accept friend request directly from notification."""
-        notifications = self.page.locator(".notification-item:has-text('friend request'), .friend-request-notification")
-        if notifications.count() > index:
-            accept_btn = notifications.nth(index).locator(".accept-btn, button:has-text('Accept')")
-            if accept_btn.count() > 0:
-                accept_btn.click()
-                self.wait_for_timeout(1000)
-                return True
-        return False
+        items = self.all_friend_request_items()
+        return index < len(items) and self.accept_friend_request_item(items[index])
     
     def reject_friend_request_from_notification(self, index: int = 0):
         """Reject friend request directly from notification."""
-        notifications = self.page.locator(".notification-item:has-text('friend request'), .friend-request-notification")
-        if notifications.count() > index:
-            reject_btn = notifications.nth(index).locator(".reject-btn, button:has-text('Reject')")
-            if reject_btn.count() > 0:
-                reject_btn.click()
-                self.wait_for_timeout(1000)
-                return True
-        return False
+        items = self.all_friend_request_items()
+        return index < len(items) and self.reject_friend_request_item(items[index])
     
     # ==================== EMPTY STATE ====================
+    @cached_property
+    def no_notifications_message(self):
+        """Locator for the empty state, by class or by its message text."""
+        return self.page.locator(".no-notifications-message, .empty-state").or_(
+            self.page.locator("p", has_text="No notifications")
+        )
+    
     def is_no_notifications_message_visible(self):
         """Check if 'no notifications' message is visible."""
-        return self.is_visible(".no-notifications-message, .empty-state, p:has-text('No notifications')")
+        try:
+            self.no_notifications_message.first.wait_for(state="visible", timeout=Config.Timeouts.ELEMENT_WAIT)
+            return True
+        except PlaywrightTimeoutError:
+            return False
     
     def get_empty_state_message(self):
         """Get the empty state message text."""
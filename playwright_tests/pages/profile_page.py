@@ -3,7 +3,8 @@ Profile Page Object.
 Handles all interactions with the user profile page.
 """
 
-from playwright.sync_api import Page
+import re
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 from .base_page import BasePage
 from constants.selectors import Selectors
 from constants.urls import URLs
@@ -36,6 +37,37 @@ class ProfilePage(BasePage):
         """Check if currently on profile page."""
         return "profile.html" in self.page.url or "user-profile.html" in self.page.url
     
+    def wait_for_profile_loaded(self, timeout: int = 5000):
+        """Wait until the profile header is rendered.
+        
+        Returns:
+            True if the header appeared within timeout, False otherwise
+        """
+        try:
+            self.page.locator("#displayName, .profile-name, #userName, .profile-username").first.wait_for(timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            logger.info(f"Profile did not load within {timeout}ms")
+            return False
+    
+    def wait_for_posts_loaded(self, timeout: int = 5000):
+        """Wait until the user's posts or the empty state are rendered.
+        
+        Returns:
+            True if the posts settled within timeout, False otherwise
+        """
+        try:
+            self.page.wait_for_function(
+                """() =>
+                    document.querySelectorAll('.post-card, .post').length > 0 ||
+                    document.querySelector('.no-posts-message, .empty-state') !== null""",
+                timeout=timeout
+            )
+            return True
+        except PlaywrightTimeoutError:
+            logger.info(f"Profile posts did not load within {timeout}ms")
+            return False
+    
     # ==================== PROFILE INFO ====================
     def get_profile_name(self):
         """Get profile display name."""
@@ -76,7 +108,6 @@ class ProfilePage(BasePage):
         if count_elem.count() > 0:
             text = count_elem.first.text_content()
             # Extract number from text
-            import re
             match = re.search(r'\d+', text)
             return int(match.group()) if match else 0
         return 0
@@ -86,7 +117,6 @@ class ProfilePage(BasePage):
         count_elem = self.page.locator(".friends-count, #friendsCount")
         if count_elem.count() > 0:
             text = count_elem.first.text_content()
-            import re
             match = re.search(r'\d+', text)
             return int(match.group()) if match else 0
         return 0
@@ -100,7 +130,7 @@ class ProfilePage(BasePage):
         """Click edit profile button."""
         logger.info("Clicking edit profile button")
         self.click("[data-bs-target='#editModal'], #editProfileBtn")
-        self.wait_for_timeout(500)
+        self.page.locator("#editModal").wait_for(state="visible", timeout=3000)
     
     def is_edit_modal_visible(self):
         """Check if edit profile modal is visible."""
@@ -130,7 +160,7 @@ class ProfilePage(BasePage):
         close_btn = self.page.locator("#editModal .btn-close, #editModal [data-bs-dismiss='modal']")
         if close_btn.count() > 0:
             close_btn.first.click()
-            self.wait_for_timeout(300)
+            self.page.locator("#editModal").wait_for(state="hidden", timeout=3000)
     
     def update_profile(self, name: str = None, bio: str = None, avatar_path: str = None):
         """
@@ -143,7 +173,6 @@ class ProfilePage(BasePage):
         """
         logger.info("Updating profile")
         self.click_edit_profile()
-        self.wait_for_timeout(500)
         
         if name:
             self.enter_edit_name(name)
@@ -4,12 +4,14 @@ Handles all interactions with the signup/registration page.
 Updated to match actual HTML structure with Bootstrap toasts.
 """
 
+from functools import cached_property
 from playwright.sync_api import Page
 from .base_page import BasePage
 from constants.selectors import Selectors
 from constants.urls import URLs
 from constants.messages import Messages
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +19,23 @@ logger = logging.getLogger(__name__)
 class SignupPage(BasePage):
     """Signup page object for registration testing."""
     
+    # Seconds a positive toast check is reused by the get_*_toast_message methods
+    TOAST_CACHE_TTL = 0.5
+    
+    # Field name -> state check method, resolved with getattr by the assertions
+    _INVALID_METHOD = {
+        'name': 'is_name_invalid',
+        'username': 'is_username_invalid',
+        'email': 'is_email_invalid',
+        'password': 'is_password_invalid'
+    }
+    _VALID_METHOD = {
+        'name': 'is_name_valid',
+        'username': 'is_username_valid',
+        'email': 'is_email_valid',
+        'password': 'is_password_valid'
+    }
+    
     def __init__(self, page: Page):
         """
         Initialize signup page.
@@ -27,11 +46,84 @@ class SignupPage(BasePage):
         super().__init__(page)
         self.selectors = Selectors.Signup
         self.url = URLs.Pages.signup()
+        
+        # Bind selector strings once so hot paths skip the class attribute lookups
+        sel = Selectors.Signup
+        (self._name, self._user, self._email, self._pw, self._btn, self._form,
+         self._login_link, self._toggle, self._spinner, self._ok_toast,
+         self._err_toast, self._toast_body) = (
+            sel.NAME_INPUT, sel.USERNAME_INPUT, sel.EMAIL_INPUT, sel.PASSWORD_INPUT,
+            sel.SIGNUP_BUTTON, sel.FORM, sel.LOGIN_LINK, sel.TOGGLE_PASSWORD,
+            sel.BTN_SPINNER, sel.SUCCESS_TOAST, sel.ERROR_TOAST, sel.TOAST_BODY
+        )
+        
+        # Composite toast selectors are constant, so format them once
+        self._ok_show = f"{self._ok_toast}.show"
+        self._err_show = f"{self._err_toast}.show"
+        self._invalid_field = f"{self._form} {sel.IS_INVALID}"
+        
+        # Elements that must all be visible on a loaded signup page
+        self._essential_selectors = (
+            self._form, self._name, self._user, self._email,
+            self._pw, self._btn, self._login_link
+        )
+        self._essentials = ", ".join(self._essential_selectors)
+        
+        # kind -> (monotonic timestamp, visible, toast locator); cleared on navigation
+        self._toast_cache = {}
+    
+    # ==================== LOCATORS ====================
+    
+    @cached_property
+    def name_input(self):
+        """Full name input locator."""
+        return self._loc(self._name)
+    
+    @cached_property
+    def username_input(self):
+        """Username input locator."""
+        return self._loc(self._user)
+    
+    @cached_property
+    def email_input(self):
+        """Email input locator."""
+        return self._loc(self._email)
+    
+    @cached_property
+    def password_input(self):
+        """Password input locator."""
+        return self._loc(self._pw)
+    
+    @cached_property
+    def signup_button(self):
+        """Signup submit button locator."""
+        return self._loc(self._btn)
+    
+    @cached_property
+    def password_toggle(self):
+        """Password visibility toggle locator."""
+        return self._loc(self._toggle)
+    
+    @cached_property
+    def login_link(self):
+        """Login link locator."""
+        return self._loc(self._login_link)
+    
+    @cached_property
+    def success_toast(self):
+        """Signup success toast locator."""
+        return self._loc(self._ok_toast)
+    
+    @cached_property
+    def error_toast(self):
+        """Signup failure toast locator."""
+        return self._loc(self._err_toast)
     
     # ==================== NAVIGATION ====================
     
     def navigate(self):
         """Navigate to signup page."""
+        self._toast_cache.clear()
         super().navigate(self.url)
         logger.info("Navigated to signup page")
     
@@ -53,8 +145,8 @@ class SignupPage(BasePage):
         Args:
             name: Full name to enter
         """
-        logger.info(f"Entering name: {name}")
-        self.fill(self.selectors.NAME_INPUT, name)
+        logger.info("Entering name: %s", name)
+        self.fill(self._name, name)
     
     def enter_username(self, username: str):
         """
@@ -63,8 +155,8 @@ class SignupPage(BasePage):
         Args:
             username: Username to enter
         """
-        logger.info(f"Entering username: {username}")
-        self.fill(self.selectors.USERNAME_INPUT, username)
+        logger.info("Entering username: %s", username)
+        self.fill(self._user, username)
     
     def enter_email(self, email: str):
         """
@@ -73,8 +165,8 @@ class SignupPage(BasePage):
         Args:
             email: Email address to enter
         """
-        logger.info(f"Entering email: {email}")
-        self.fill(self.selectors.EMAIL_INPUT, email)
+        logger.info("Entering email: %s", email)
+        self.fill(self._email, email)
     
     def enter_password(self, password: str):
         """
@@ -84,22 +176,22 @@ class SignupPage(BasePage):
             password: Password to enter
         """
         logger.info("Entering password")
-        self.fill(self.selectors.PASSWORD_INPUT, password)
+        self.fill(self._pw, password)
     
     def click_signup_button(self):
         """Click the signup button to submit the form."""
         logger.info("Clicking signup button")
-        self.click(self.selectors.SIGNUP_BUTTON)
+        self.click(self._btn)
     
     def click_login_link(self):
         """Click the 'Log In' link to navigate to login page."""
         logger.info("Clicking login link")
-        self.click(self.selectors.LOGIN_LINK)
+        self.click(self._login_link)
     
     def toggle_password_visibility(self):
         """Toggle password field visibility."""
         logger.info("Toggling password visibility")
-        self.click(self.selectors.TOGGLE_PASSWORD)
+        self.click(self._toggle)
     
     def signup(self, name: str, username: str, email: str, password: str):
         """
@@ -112,15 +204,15 @@ class SignupPage(BasePage):
             email: Email address
             password: Password
         """
-        logger.info(f"Signing up with username: {username}")
+        logger.info("Signing up with username: %s", username)
         self.enter_name(name)
         self.enter_username(username)
         self.enter_email(email)
         self.enter_password(password)
         self.click_signup_button()
         
-        # Wait for either redirect or toast message
-        self.wait_for_timeout(2500)
+        # Wait for the request to settle (spinner hidden) before checking the outcome
+        self.wait_until_not_loading()
     
     def signup_with_user_data(self, user_data: dict):
         """
@@ -153,31 +245,110 @@ class SignupPage(BasePage):
             logger.warning("Signup failed - not redirected to login page")
             return False
     
-    def is_success_toast_displayed(self) -> bool:
+    def is_signup_definitely_failed(self, timeout: int = 1500) -> bool:
         """
-        Check if success toast is displayed.
+        Check that signup failed without paying the full redirect timeout.
+        
+        Races the redirect to the login page (or the success toast) against
+        the evidence of failure - the error toast, or fields marked invalid
+        by client-side validation - in a single browser-side wait. If neither
+        shows up in time, falls back to the full redirect wait.
         
+        Args:
+            timeout: Maximum time to wait for the quick outcome in milliseconds
+            
         Returns:
-            True if success toast is visible, False otherwise
+            True if the error toast or an invalid field showed, or the redirect
+            never came; False if signup succeeded
         """
         try:
-            self.wait_for_selector(f"{self.selectors.SUCCESS_TOAST}.show", timeout=3000)
-            return True
+            outcome = self.page.wait_for_function(
+                """([err, ok, invalid]) => {
+                    if (location.pathname.endsWith('login.html') || document.querySelector(ok)) return 'succeeded';
+                    if (document.querySelector(err) || document.querySelector(invalid)) return 'failed';
+                    return false;
+                }""",
+                arg=[self._err_show, self._ok_show, self._invalid_field],
+                timeout=timeout
+            ).json_value()
+            return outcome == 'failed'
         except Exception:
-            return False
+            # The redirect tore down the page mid-wait
+            if "login.html" in self.get_current_url():
+                return False
+            # No outcome yet (e.g. a slow backend): wait for the redirect in full
+            return not self.is_signup_successful()
     
-    def is_error_toast_displayed(self) -> bool:
+    def _check_toast(self, kind: str, selector: str, timeout: int) -> bool:
         """
-        Check if error toast is displayed.
+        Check toast visibility and remember the result for a short time.
         
+        Args:
+            kind: Cache key ('success' or 'error')
+            selector: Selector of the shown toast
+            timeout: Milliseconds to wait for the toast; 0 checks immediately
+            
         Returns:
-            True if error toast is visible, False otherwise
+            True if the toast is visible, False otherwise
         """
+        toast = self.page.locator(selector)
         try:
-            self.wait_for_selector(f"{self.selectors.ERROR_TOAST}.show", timeout=3000)
-            return True
+            if timeout == 0:
+                shown = toast.is_visible()
+            else:
+                toast.wait_for(state="visible", timeout=timeout)
+                shown = True
         except Exception:
-            return False
+            shown = False
+        self._toast_cache[kind] = (time.monotonic(), shown, toast)
+        return shown
+    
+    def _read_toast(self, kind: str, selector: str) -> str:
+        """
+        Read a toast body, reusing a recent positive visibility check.
+        
+        Args:
+            kind: Cache key ('success' or 'error')
+            selector: Selector of the shown toast
+            
+        Returns:
+            Toast message text, or empty string if the toast is not shown
+        """
+        cached = self._toast_cache.get(kind)
+        try:
+            if cached and cached[1] and time.monotonic() - cached[0] < self.TOAST_CACHE_TTL:
+                return cached[2].locator(self._toast_body).text_content(timeout=3000) or ""
+            
+            # One wait yields the toast handle; read the body from it directly
+            toast = self.page.wait_for_selector(selector, timeout=3000)
+            body = toast.query_selector(self._toast_body) if toast else None
+            return (body.text_content() or "") if body else ""
+        except Exception:
+            return ""
+    
+    def is_success_toast_displayed(self, timeout: int = 0) -> bool:
+        """
+        Check if success toast is displayed.
+        
+        Args:
+            timeout: Milliseconds to wait for the toast; 0 checks immediately
+            
+        Returns:
+            True if success toast is visible, False otherwise
+        """
+        return self._check_toast('success', self._ok_show, timeout)
+    
+    def is_error_toast_displayed(self, timeout: int = 0) -> bool:
+        """
+        Check if error toast is displayed.
+        
+        Args:
+            timeout: Milliseconds to wait for the toast; 0 checks immediately
+            
+        Returns:
+            True if error toast is visible, False otherwise
+        """
+        return self._check_toast('error', self._err_show, timeout)
     
     def get_success_toast_message(self) -> str:
         """
@@ -186,9 +357,7 @@ class SignupPage(BasePage):
         Returns:
             Success toast message text
         """
-        if self.is_success_toast_displayed():
-            return self.get_text(f"{self.selectors.SUCCESS_TOAST} {self.selectors.TOAST_BODY}")
-        return ""
+        return self._read_toast('success', self._ok_show)
     
     def get_error_toast_message(self) -> str:
         """
@@ -197,9 +366,7 @@ class SignupPage(BasePage):
         Returns:
             Error toast message text
         """
-        if self.is_error_toast_displayed():
-            return self.get_text(f"{self.selectors.ERROR_TOAST} {self.selectors.TOAST_BODY}")
-        return ""
+        return self._read_toast('error', self._err_show)
     
     # ==================== FIELD VALIDATION ====================
     
@@ -214,7 +381,7 @@ class SignupPage(BasePage):
             True if field has is-invalid class
         """
         try:
-            return self.page.locator(f"{field}.is-invalid").is_visible()
+            return self.page.eval_on_selector(field, "e => e.classList.contains('is-invalid')")
         except Exception:
             return False
     
@@ -229,41 +396,41 @@ class SignupPage(BasePage):
             True if field has is-valid class
         """
         try:
-            return self.page.locator(f"{field}.is-valid").is_visible()
+            return self.page.eval_on_selector(field, "e => e.classList.contains('is-valid')")
         except Exception:
             return False
     
     def is_name_invalid(self) -> bool:
         """Check if name field has validation error."""
-        return self.is_field_invalid(self.selectors.NAME_INPUT)
+        return self.is_field_invalid(self._name)
     
     def is_name_valid(self) -> bool:
         """Check if name field has been validated successfully."""
-        return self.is_field_valid(self.selectors.NAME_INPUT)
+        return self.is_field_valid(self._name)
     
     def is_username_invalid(self) -> bool:
         """Check if username field has validation error."""
-        return self.is_field_invalid(self.selectors.USERNAME_INPUT)
+        return self.is_field_invalid(self._user)
     
     def is_username_valid(self) -> bool:
         """Check if username field has been validated successfully."""
-        return self.is_field_valid(self.selectors.USERNAME_INPUT)
+        return self.is_field_valid(self._user)
     
     def is_email_invalid(self) -> bool:
         """Check if email field has validation error."""
-        return self.is_field_invalid(self.selectors.EMAIL_INPUT)
+        return self.is_field_invalid(self._email)
     
     def is_email_valid(self) -> bool:
         """Check if email field has been validated successfully."""
-        return self.is_field_valid(self.selectors.EMAIL_INPUT)
+        return self.is_field_valid(self._email)
     
     def is_password_invalid(self) -> bool:
         """Check if password field has validation error."""
-        return self.is_field_invalid(self.selectors.PASSWORD_INPUT)
+        return self.is_field_invalid(self._pw)
     
     def is_password_valid(self) -> bool:
         """Check if password field has been validated successfully."""
-        return self.is_field_valid(self.selectors.PASSWORD_INPUT)
+        return self.is_field_valid(self._pw)
     
     def trigger_field_validation(self, field_selector: str):
         """
@@ -278,10 +445,10 @@ class SignupPage(BasePage):
     
     def validate_all_fields(self):
         """Trigger validation on all form fields."""
-        self.trigger_field_validation(self.selectors.NAME_INPUT)
-        self.trigger_field_validation(self.selectors.USERNAME_INPUT)
-        self.trigger_field_validation(self.selectors.EMAIL_INPUT)
-        self.trigger_field_validation(self.selectors.PASSWORD_INPUT)
+        self.trigger_field_validation(self._name)
+        self.trigger_field_validation(self._user)
+        self.trigger_field_validation(self._email)
+        self.trigger_field_validation(self._pw)
     
     # ==================== LOADING STATE ====================
     
@@ -293,21 +460,43 @@ class SignupPage(BasePage):
             True if spinner is visible, False otherwise
         """
         try:
-            spinner = self.page.locator(self.selectors.BTN_SPINNER)
-            class_attr = spinner.get_attribute("class") or ""
-            return "d-none" not in class_attr
+            # Single evaluation instead of locator + get_attribute round-trips
+            return self.page.eval_on_selector(
+                self._spinner,
+                "e => !!e && !e.classList.contains('d-none')"
+            )
+        except Exception:
+            return False
+    
+    def wait_until_not_loading(self, timeout: int = 10000) -> bool:
+        """
+        Wait until the signup spinner is hidden.
+        
+        Uses a single locator wait resolved in the browser instead of
+        polling is_loading(). Also resolves when the page redirects away.
+        
+        Args:
+            timeout: Maximum time to wait in milliseconds
+            
+        Returns:
+            True if loading finished within the timeout, False otherwise
+        """
+        try:
+            self.page.locator(self._spinner).wait_for(state="hidden", timeout=timeout)
+            return True
         except Exception:
+            logger.warning("Signup still loading after %sms", timeout)
             return False
     
     def is_button_disabled(self) -> bool:
         """Check if signup button is disabled."""
-        return self.is_disabled(self.selectors.SIGNUP_BUTTON)
+        return self.is_disabled(self._btn)
     
     # ==================== LEGACY COMPATIBILITY METHODS ====================
     
     def is_error_message_displayed(self) -> bool:
         """Legacy alias for is_error_toast_displayed."""
-        return self.is_error_toast_displayed()
+        return self.is_error_toast_displayed(timeout=3000)
     
     def get_error_message(self) -> str:
         """Legacy alias for get_error_toast_message."""
@@ -315,7 +504,7 @@ class SignupPage(BasePage):
     
     def is_success_message_displayed(self) -> bool:
         """Legacy alias for is_success_toast_displayed."""
-        return self.is_success_toast_displayed()
+        return self.is_success_toast_displayed(timeout=3000)
     
     def get_success_message(self) -> str:
         """Legacy alias for get_success_toast_message."""
@@ -325,79 +514,94 @@ class SignupPage(BasePage):
     
     def get_name_value(self) -> str:
         """Get current value in name field."""
-        return self.get_value(self.selectors.NAME_INPUT)
+        return self.get_value(self._name)
     
     def get_username_value(self) -> str:
         """Get current value in username field."""
-        return self.get_value(self.selectors.USERNAME_INPUT)
+        return self.get_value(self._user)
     
     def get_email_value(self) -> str:
         """Get current value in email field."""
-        return self.get_value(self.selectors.EMAIL_INPUT)
+        return self.get_value(self._email)
     
     def get_password_value(self) -> str:
         """Get current value in password field."""
-        return self.get_value(self.selectors.PASSWORD_INPUT)
+        return self.get_value(self._pw)
     
     def is_password_visible(self) -> bool:
         """Check if password is visible (type='text')."""
-        password_type = self.get_attribute(self.selectors.PASSWORD_INPUT, "type")
+        password_type = self.get_attribute(self._pw, "type")
         return password_type == "text"
     
     # ==================== HELPER METHODS ====================
     
     def clear_name(self):
         """Clear name field."""
-        self.fill(self.selectors.NAME_INPUT, "")
+        self.fill(self._name, "")
     
     def clear_username(self):
         """Clear username field."""
-        self.fill(self.selectors.USERNAME_INPUT, "")
+        self.fill(self._user, "")
     
     def clear_email(self):
         """Clear email field."""
-        self.fill(self.selectors.EMAIL_INPUT, "")
+        self.fill(self._email, "")
     
     def clear_password(self):
         """Clear password field."""
-        self.fill(self.selectors.PASSWORD_INPUT, "")
+        self.fill(self._pw, "")
     
     def clear_form(self):
         """Clear all signup form fields."""
-        self.clear_name()
-        self.clear_username()
-        self.clear_email()
-        self.clear_password()
+        self.bulk_fill({self._name: "", self._user: "", self._email: "", self._pw: ""})
     
     # ==================== PAGE ELEMENT VERIFICATION ====================
     
     def is_form_visible(self) -> bool:
         """Check if signup form is visible."""
-        return self.is_visible(self.selectors.FORM)
+        return self.is_visible(self._form)
     
     def is_name_input_visible(self) -> bool:
         """Check if name input is visible."""
-        return self.is_visible(self.selectors.NAME_INPUT)
+        return self.is_visible(self._name)
     
     def is_username_input_visible(self) -> bool:
         """Check if username input is visible."""
-        return self.is_visible(self.selectors.USERNAME_INPUT)
+        return self.is_visible(self._user)
     
     def is_email_input_visible(self) -> bool:
         """Check if email input is visible."""
-        return self.is_visible(self.selectors.EMAIL_INPUT)
+        return self.is_visible(self._email)
     
     def is_password_input_visible(self) -> bool:
         """Check if password input is visible."""
-        return self.is_visible(self.selectors.PASSWORD_INPUT)
+        return self.is_visible(self._pw)
     
     def is_signup_button_visible(self) -> bool:
         """Check if signup button is visible."""
-        return self.is_visible(self.selectors.SIGNUP_BUTTON)
+        return self.is_visible(self._btn)
     
     def is_login_link_visible(self) -> bool:
         """Check if login link is visible."""
-        return self.is_visible(self.selectors.LOGIN_LINK)
+        return self.is_visible(self._login_link)
+    
+    def check_all_elements_visible(self) -> dict:
+        """
+        Check visibility of all signup form elements in one round-trip.
+        
+        Returns:
+            Mapping of element name to visibility
+        """
+        return self.check_visible({
+            'form': self._form,
+            'name': self._name,
+            'username': self._user,
+            'email': self._email,
+            'password': self._pw,
+            'signup_button': self._btn,
+            'password_toggle': self._toggle,
+            'login_link': self._login_link
+        })
     
     def are_all_elements_visible(self) -> bool:
         """
@@ -406,15 +610,14 @@ class SignupPage(BasePage):
         Returns:
             True if all elements are visible, False otherwise
         """
-        return all([
-            self.is_form_visible(),
-            self.is_name_input_visible(),
-            self.is_username_input_visible(),
-            self.is_email_input_visible(),
-            self.is_password_input_visible(),
-            self.is_signup_button_visible(),
-            self.is_login_link_visible()
-        ])
+        # One combined query checks every element in a single round-trip
+        try:
+            return self.page.locator(self._essentials).evaluate_all(
+                "(els, n) => els.length === n && els.every(e => e.offsetParent !== null)",
+                len(self._essential_selectors)
+            )
+        except Exception:
+            return False
     
     # ==================== ASSERTIONS ====================
     
@@ -430,7 +633,7 @@ class SignupPage(BasePage):
     
     def assert_signup_failed(self):
         """Assert that signup failed (not redirected)."""
-        assert not self.is_signup_successful(), "Signup should have failed but succeeded"
+        assert self.is_signup_definitely_failed(), "Signup should have failed but succeeded"
         logger.info("Assertion passed: Signup failed as expected")
     
     def assert_error_toast_displayed(self, expected_message: str = None):
@@ -440,7 +643,7 @@ class SignupPage(BasePage):
         Args:
             expected_message: Optional expected message text (partial match)
         """
-        assert self.is_error_toast_displayed(), "Error toast not displayed"
+        assert self.is_error_toast_displayed(timeout=3000), "Error toast not displayed"
         
         if expected_message:
             actual_message = self.get_error_toast_message()
@@ -456,7 +659,7 @@ class SignupPage(BasePage):
         Args:
             expected_message: Optional expected message text (partial match)
         """
-        assert self.is_success_toast_displayed(), "Success toast not displayed"
+        assert self.is_success_toast_displayed(timeout=3000), "Success toast not displayed"
         
         if expected_message:
             actual_message = self.get_success_toast_message()
@@ -472,19 +675,12 @@ class SignupPage(BasePage):
         Args:
             field_name: Name of field ('name', 'username', 'email', 'password')
         """
-        field_checks = {
-            'name': self.is_name_invalid,
-            'username': self.is_username_invalid,
-            'email': self.is_email_invalid,
-            'password': self.is_password_invalid
-        }
-        
-        check_func = field_checks.get(field_name)
-        if check_func:
-            assert check_func(), f"Field '{field_name}' should be invalid but is not"
-            logger.info(f"Assertion passed: {field_name} field is invalid")
-        else:
+        method_name = self._INVALID_METHOD.get(field_name)
+        if not method_name:
             raise ValueError(f"Unknown field name: {field_name}")
+        
+        assert getattr(self, method_name)(), f"Field '{field_name}' should be invalid but is not"
+        logger.info("Assertion passed: %s field is invalid", field_name)
     
     def assert_field_valid(self, field_name: str):
         """
@@ -493,19 +689,12 @@ class SignupPage(BasePage):
         Args:
             field_name: Name of field ('name', 'username', 'email', 'password')
         """
-        field_checks = {
-            'name': self.is_name_valid,
-            'username': self.is_username_valid,
-            'email': self.is_email_valid,
-            'password': self.is_password_valid
-        }
-        
-        check_func = field_checks.get(field_name)
-        if check_func:
-            assert check_func(), f"Field '{field_name}' should be valid but is not"
-            logger.info(f"Assertion passed: {field_name} field is valid")
-        else:
+        method_name = self._VALID_METHOD.get(field_name)
+        if not method_name:
             raise ValueError(f"Unknown field name: {field_name}")
+        
+        assert getattr(self, method_name)(), f"Field '{field_name}' should be valid but is not"
+        logger.info("Assertion passed: %s field is valid", field_name)
     
     def assert_all_elements_visible(self):
         """Assert that all essential signup page elements are visible."""
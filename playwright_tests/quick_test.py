@@ -1,20 +1,86 @@
 """Quick test to verify basic functionality works."""
 import sys
-sys.path.insert(0, '.')
+import hashlib
+import json
+import os
+import time
 
-from playwright.sync_api import sync_playwright
-from pages.login_page import LoginPage
-from constants.urls import URLs
+# Static asset cache: URL -> file under .cache/, tracked in a JSON manifest
+CACHE_DIR = '.cache'
+CACHE_MANIFEST = os.path.join(CACHE_DIR, 'manifest.json')
+CACHE_TTL = 15 * 60  # seconds
+STATIC_ASSETS = "**/*.{css,js,png,jpg,svg,woff,woff2}"
+
+
+def _load_manifest():
+    try:
+        with open(CACHE_MANIFEST) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(manifest):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(CACHE_MANIFEST, 'w') as f:
+        json.dump(manifest, f)
+
+
+def _cached(manifest, url):
+    """Return the cache entry for url if it is still fresh, else None."""
+    entry = manifest.get(url)
+    if entry and time.time() - entry['time'] < CACHE_TTL and os.path.exists(entry['path']):
+        return entry
+    return None
+
+
+def _serve_static(manifest):
+    """Build a route handler that serves static GETs from the disk cache."""
+    def handler(route):
+        request = route.request
+        if request.method != 'GET':
+            route.continue_()
+            return
+        
+        entry = _cached(manifest, request.url)
+        if entry:
+            route.fulfill(path=entry['path'], headers={'content-type': entry['content_type']})
+            return
+        
+        response = route.fetch()
+        if response.ok:
+            path = os.path.join(CACHE_DIR, hashlib.sha1(request.url.encode()).hexdigest())
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(response.body())
+            manifest[request.url] = {
+                'path': path,
+                'time': time.time(),
+                'content_type': response.headers.get('content-type', '')
+            }
+        route.fulfill(response=response)
+    return handler
 
 def test_login_page():
+    # Imported here so importing this module has no Playwright/page-object side effects
+    from playwright.sync_api import sync_playwright
+    from pages.login_page import LoginPage
+    from constants.urls import URLs
+    
     print(f"Testing with BASE_URL: {URLs.BASE_URL}")
     print(f"Login URL: {URLs.Pages.login()}")
     
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
+        # Persistent profile keeps the browser cache warm between runs
+        context = p.chromium.launch_persistent_context(
+            user_data_dir='.pw-cache/quick',
+            headless=False
+        )
         page = context.new_page()
         
+        manifest = _load_manifest()
+        page.route(STATIC_ASSETS, _serve_static(manifest))
+        
         login_page = LoginPage(page)
         login_page.navigate()
         
@@ -28,8 +94,10 @@ def test_login_page():
         page.screenshot(path="login_page_test.png")
         print("Screenshot saved to login_page_test.png")
         
-        browser.close()
+        context.close()
+        _save_manifest(manifest)
         print("Test completed successfully!")
 
 if __name__ == "__main__":
+    sys.path.insert(0, '.')
     test_login_page()
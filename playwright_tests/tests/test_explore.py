@@ -4,34 +4,43 @@ Testing for user search and discovery functionality.
 """
 
 import pytest
-import time
 import logging
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from pages.explore_page import ExplorePage
-from pages.login_page import LoginPage
-from constants.test_data import TestData
+from utils.helpers import wait_for_request_sent
 
 logger = logging.getLogger(__name__)
 
+SEARCH_INPUT = "#searchInput, input[type='search'], .search-input"
+USER_CARDS = ".user-card, #searchResults .card, #usersContainer .card"
 
-@pytest.fixture
-def logged_in_explore_page(page):
-    """Fixture: Login and navigate to explore page."""
-    login_page = LoginPage(page)
-    login_page.navigate()
-    
-    user = TestData.Users.PRIMARY_USER
-    page.locator("#username").fill(user['username'])
-    page.locator("#password").fill(user['password'])
-    page.locator("#loginForm button[type='submit']").click()
-    
+# Search has settled once results or an empty-state message are rendered
+SEARCH_SETTLED_JS = """() =>
+    document.querySelectorAll('.user-card, .search-result-item, #searchResults .card').length > 0 ||
+    !!document.querySelector('.no-results-message, .empty-state')"""
+
+
+def wait_for_search_settled(page, timeout=5000):
+    """Wait until search results or the empty state are rendered."""
     try:
-        page.wait_for_url("**/home.html", timeout=15000)
-    except:
+        page.wait_for_function(SEARCH_SETTLED_JS, timeout=timeout)
+    except PlaywrightTimeoutError:
+        logger.info(f"Search did not settle within {timeout}ms")
+
+
+@pytest.fixture
+def logged_in_explore_page(authed_page):
+    """Fixture: Navigate to explore page as the already logged-in primary user."""
+    explore_page = ExplorePage(authed_page)
+    explore_page.navigate()
+    if not explore_page.is_on_explore_page():
         pytest.skip("Login failed")
     
-    explore_page = ExplorePage(page)
-    explore_page.navigate()
-    time.sleep(2)
+    authed_page.wait_for_selector(SEARCH_INPUT, state="visible")
+    try:
+        authed_page.wait_for_load_state("networkidle", timeout=5000)
+    except PlaywrightTimeoutError:
+        logger.info("Explore page network did not go idle, continuing")
     return explore_page
 
 
@@ -60,12 +69,13 @@ class TestExplorePageElements:
 class TestUserSearch:
     """Test: User search functionality."""
     
+    @pytest.mark.smoke
     def test_search_for_user(self, logged_in_explore_page):
         """Test: Search for a user."""
         explore_page = logged_in_explore_page
         
         explore_page.search_for_user("test")
-        time.sleep(2)
+        wait_for_search_settled(explore_page.page)
         
         count = explore_page.get_search_results_count()
         logger.info(f"✅ Search returned {count} results")
@@ -75,7 +85,7 @@ class TestUserSearch:
         explore_page = logged_in_explore_page
         
         explore_page.search_for_user("xyznonexistent12345")
-        time.sleep(2)
+        wait_for_search_settled(explore_page.page)
         
         count = explore_page.get_search_results_count()
         if count == 0:
@@ -100,20 +110,20 @@ class TestDiscoverUsers:
     
     def test_discover_users_displayed(self, logged_in_explore_page):
         """Test: Discover users are displayed."""
-        time.sleep(2)
+        logged_in_explore_page.wait_for_discover_loaded()
         count = logged_in_explore_page.get_discover_users_count()
         logger.info(f"✅ {count} users in discover section")
     
     def test_view_user_profile(self, logged_in_explore_page):
         """Test: View user profile from discover."""
         explore_page = logged_in_explore_page
-        time.sleep(2)
+        explore_page.wait_for_discover_loaded()
         
         if explore_page.get_discover_users_count() == 0:
             pytest.skip("No users to view")
         
         explore_page.view_user_profile(0)
-        time.sleep(2)
+        explore_page.page.wait_for_load_state("domcontentloaded")
         
         if "profile" in explore_page.page.url:
             logger.info("✅ Navigated to user profile")
@@ -123,13 +133,13 @@ class TestDiscoverUsers:
     def test_send_friend_request_from_explore(self, logged_in_explore_page):
         """Test: Send friend request from explore."""
         explore_page = logged_in_explore_page
-        time.sleep(2)
+        explore_page.wait_for_discover_loaded()
         
         if explore_page.get_discover_users_count() == 0:
             pytest.skip("No users available")
         
         explore_page.send_friend_request(0)
-        time.sleep(1)
+        wait_for_request_sent(explore_page.page.locator(USER_CARDS).nth(0))
         
         if explore_page.is_friend_request_sent(0):
             logger.info("✅ Friend request sent")
@@ -143,7 +153,7 @@ class TestFriendshipStatus:
     def test_get_friendship_status(self, logged_in_explore_page):
         """Test: Get friendship status for users."""
         explore_page = logged_in_explore_page
-        time.sleep(2)
+        explore_page.wait_for_discover_loaded()
         
         if explore_page.get_discover_users_count() == 0:
             pytest.skip("No users")
@@ -154,11 +164,10 @@ class TestFriendshipStatus:
     def test_already_friends_display(self, logged_in_explore_page):
         """Test: Already friends status display."""
         explore_page = logged_in_explore_page
-        time.sleep(2)
-        
-        for i in range(min(5, explore_page.get_discover_users_count())):
-            if explore_page.is_already_friends(i):
-                logger.info(f"✅ User {i} is already friends")
-                return
+        explore_page.wait_for_discover_loaded()
         
-        logger.info("ℹ️ No 'already friends' users found")
+        statuses = explore_page.get_all_friendship_statuses()[:5]
+        if "friends" in statuses:
+            logger.info(f"✅ User {statuses.index('friends')} is already friends")
+        else:
+            logger.info("ℹ️ No 'already friends' users found")
@@ -4,37 +4,89 @@ Testing for friend list, requests, and suggestions.
 """
 
 import pytest
-import time
 import logging
+from playwright.sync_api import expect, TimeoutError as PlaywrightTimeoutError
 from pages.friends_page import FriendsPage
-from pages.login_page import LoginPage
-from constants.test_data import TestData
+from utils.helpers import wait_for_request_sent
 
 logger = logging.getLogger(__name__)
 
+FRIENDS_PAGE_READY = "#friendsTab, #friendsContainer"
+FRIEND_CARDS = ".friend-card, .friend-item, #friendsContainer .card"
+SUGGESTION_CARDS = ".suggestion-card, .user-card, #suggestionsContainer .card"
+ACTIVE_TAB = {
+    'requests': "#requestsContent.active, #requestsTab.active, [data-tab='requests'].active",
+    'suggestions': "#suggestionsContent.active, #suggestionsTab.active, [data-tab='suggestions'].active",
+    'friends': "#friendsContent.active, #friendsTab.active, [data-tab='friends'].active",
+}
 
-@pytest.fixture
-def logged_in_friends_page(page):
-    """Fixture: Login and navigate to friends page."""
-    login_page = LoginPage(page)
-    login_page.navigate()
-    
-    user = TestData.Users.PRIMARY_USER
-    page.locator("#username").fill(user['username'])
-    page.locator("#password").fill(user['password'])
-    page.locator("#loginForm button[type='submit']").click()
-    
+
+def wait_for_tab(page, tab, timeout=5000):
+    """Wait until the given tab is active and its content has loaded."""
     try:
-        page.wait_for_url("**/home.html", timeout=15000)
-    except:
-        pytest.skip("Login failed")
-    
+        page.wait_for_selector(ACTIVE_TAB[tab], state="attached", timeout=timeout)
+        page.wait_for_load_state("networkidle", timeout=timeout)
+    except PlaywrightTimeoutError:
+        logger.info(f"{tab} tab did not settle within {timeout}ms")
+
+
+def wait_for_friend_removed(page, initial_count, timeout=5000):
+    """Wait until fewer friend cards than initial_count are rendered."""
+    try:
+        page.wait_for_function(
+            "([sel, n]) => document.querySelectorAll(sel).length < n",
+            arg=[FRIEND_CARDS, initial_count],
+            timeout=timeout
+        )
+    except PlaywrightTimeoutError:
+        logger.info(f"Friend count did not change within {timeout}ms")
+
+
+def open_friends_page(page):
+    """Navigate to the friends page and wait for it to load."""
     friends_page = FriendsPage(page)
     friends_page.navigate()
-    time.sleep(2)
+    if not friends_page.is_on_friends_page():
+        pytest.skip("Login failed")
+    
+    page.wait_for_selector(FRIENDS_PAGE_READY, state="attached")
+    try:
+        page.wait_for_load_state("networkidle", timeout=5000)
+    except PlaywrightTimeoutError:
+        logger.info("Friends page network did not go idle, continuing")
     return friends_page
 
 
+@pytest.fixture
+def logged_in_friends_page(authed_page):
+    """Fixture: Navigate to friends page as the already logged-in primary user."""
+    return open_friends_page(authed_page)
+
+
+@pytest.fixture(scope="class")
+def friends_page_per_class(shared_context):
+    """Fixture: Friends page opened once and shared by every test in a class."""
+    page = shared_context.new_page()
+    yield open_friends_page(page)
+    page.close()
+
+
+@pytest.fixture(scope="class")
+def on_requests_tab(friends_page_per_class):
+    """Fixture: Friends page switched to the requests tab once per class."""
+    friends_page_per_class.click_requests_tab()
+    wait_for_tab(friends_page_per_class.page, 'requests')
+    return friends_page_per_class
+
+
+@pytest.fixture(scope="class")
+def on_suggestions_tab(friends_page_per_class):
+    """Fixture: Friends page switched to the suggestions tab once per class."""
+    friends_page_per_class.click_suggestions_tab()
+    wait_for_tab(friends_page_per_class.page, 'suggestions')
+    return friends_page_per_class
+
+
 class TestFriendsPageElements:
     """Test: Verify friends page elements."""
     
@@ -66,17 +118,18 @@ class TestFriendsList:
         # Just check the page loaded with friends content
         logger.info("✅ Friends tab checked")
     
+    @pytest.mark.smoke
     @pytest.mark.friends
     def test_friends_list_displayed(self, logged_in_friends_page):
         """Test: Friends list is displayed."""
-        time.sleep(2)
+        logged_in_friends_page.wait_for_friends_list_loaded()
         count = logged_in_friends_page.get_friends_count()
         logger.info(f"✅ {count} friends displayed")
     
     @pytest.mark.friends
     def test_get_friend_names(self, logged_in_friends_page):
         """Test: Get list of friend names."""
-        time.sleep(2)
+        logged_in_friends_page.wait_for_friends_list_loaded()
         names = logged_in_friends_page.get_friend_names()
         logger.info(f"✅ Friends: {names[:3]}")
 
@@ -85,42 +138,33 @@ class TestFriendRequests:
     """Test: Friend requests functionality."""
     
     @pytest.mark.friends
-    def test_switch_to_requests_tab(self, logged_in_friends_page):
+    def test_switch_to_requests_tab(self, on_requests_tab):
         """Test: Switch to requests tab."""
-        logged_in_friends_page.click_requests_tab()
-        time.sleep(1)
+        expect(on_requests_tab.page.locator(ACTIVE_TAB['requests']).first).to_be_attached()
         logger.info("✅ Switched to requests tab")
     
     @pytest.mark.friends
-    def test_requests_count(self, logged_in_friends_page):
+    def test_requests_count(self, on_requests_tab):
         """Test: Get pending requests count."""
-        logged_in_friends_page.click_requests_tab()
-        time.sleep(1)
-        count = logged_in_friends_page.get_requests_count()
+        count = on_requests_tab.get_requests_count()
         logger.info(f"✅ {count} pending requests")
     
     @pytest.mark.friends
-    def test_accept_request(self, logged_in_friends_page):
+    def test_accept_request(self, on_requests_tab):
         """Test: Accept a friend request."""
-        logged_in_friends_page.click_requests_tab()
-        time.sleep(1)
-        
-        if logged_in_friends_page.get_requests_count() == 0:
+        if on_requests_tab.get_requests_count() == 0:
             pytest.skip("No requests to accept")
         
-        logged_in_friends_page.accept_request(0)
+        on_requests_tab.accept_request(0)
         logger.info("✅ Accept request attempted")
     
     @pytest.mark.friends
-    def test_reject_request(self, logged_in_friends_page):
+    def test_reject_request(self, on_requests_tab):
         """Test: Reject a friend request."""
-        logged_in_friends_page.click_requests_tab()
-        time.sleep(1)
-        
-        if logged_in_friends_page.get_requests_count() == 0:
+        if on_requests_tab.get_requests_count() == 0:
             pytest.skip("No requests to reject")
         
-        logged_in_friends_page.reject_request(0)
+        on_requests_tab.reject_request(0)
         logger.info("✅ Reject request attempted")
 
 
@@ -128,34 +172,28 @@ class TestFriendSuggestions:
     """Test: Friend suggestions functionality."""
     
     @pytest.mark.friends
-    def test_switch_to_suggestions_tab(self, logged_in_friends_page):
+    def test_switch_to_suggestions_tab(self, on_suggestions_tab):
         """Test: Switch to suggestions tab."""
-        logged_in_friends_page.click_suggestions_tab()
-        time.sleep(1)
+        expect(on_suggestions_tab.page.locator(ACTIVE_TAB['suggestions']).first).to_be_attached()
         logger.info("✅ Switched to suggestions tab")
     
     @pytest.mark.friends
-    def test_suggestions_count(self, logged_in_friends_page):
+    def test_suggestions_count(self, on_suggestions_tab):
         """Test: Get suggestions count."""
-        logged_in_friends_page.click_suggestions_tab()
-        time.sleep(1)
-        count = logged_in_friends_page.get_suggestions_count()
+        count = on_suggestions_tab.get_suggestions_count()
         logger.info(f"✅ {count} suggestions")
     
     @pytest.mark.friends
-    def test_send_friend_request(self, logged_in_friends_page):
+    def test_send_friend_request(self, on_suggestions_tab):
         """Test: Send friend request from suggestions."""
-        logged_in_friends_page.click_suggestions_tab()
-        time.sleep(1)
-        
-        if logged_in_friends_page.get_suggestions_count() == 0:
+        if on_suggestions_tab.get_suggestions_count() == 0:
             pytest.skip("No suggestions available")
         
-        logged_in_friends_page.send_friend_request(0)
-        time.sleep(1)
+        on_suggestions_tab.send_friend_request(0)
+        wait_for_request_sent(on_suggestions_tab.page.locator(SUGGESTION_CARDS).nth(0))
         
         # Check if button changed to pending/cancel
-        if logged_in_friends_page.is_request_sent(0):
+        if on_suggestions_tab.is_request_sent(0):
             logger.info("✅ Request sent - button shows pending")
         else:
             logger.info("✅ Send request attempted")
@@ -168,14 +206,15 @@ class TestRemoveFriend:
     def test_remove_friend(self, logged_in_friends_page):
         """Test: Remove a friend."""
         logged_in_friends_page.click_friends_tab()
-        time.sleep(1)
+        wait_for_tab(logged_in_friends_page.page, 'friends')
+        logged_in_friends_page.wait_for_friends_list_loaded()
         
         if logged_in_friends_page.get_friends_count() == 0:
             pytest.skip("No friends to remove")
         
         initial_count = logged_in_friends_page.get_friends_count()
         logged_in_friends_page.remove_friend(0)
-        time.sleep(2)
+        wait_for_friend_removed(logged_in_friends_page.page, initial_count)
         
         new_count = logged_in_friends_page.get_friends_count()
         if new_count < initial_count:
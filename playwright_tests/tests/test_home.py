@@ -3,37 +3,55 @@ Home/Feed Page Automation Tests
 Comprehensive testing for the home feed including posts, likes, and comments.
 """
 
+import re
+import random
 import pytest
-import time
 import logging
+from playwright.sync_api import expect
 from pages.home_page import HomePage
-from pages.login_page import LoginPage
 from constants.urls import URLs
 from constants.test_data import TestData
+from utils.helpers import wait_ready, log_banner
 
 logger = logging.getLogger(__name__)
 
+LIKED_CLASS = re.compile(r"liked|active|text-danger")
+LOGIN_URL_RE = re.compile(r"login\.html")
+PROFILE_URL_RE = re.compile(r"profile\.html")
+FRIENDS_URL_RE = re.compile(r"friends\.html")
+EXPLORE_URL_RE = re.compile(r"explore\.html")
+NOTIFICATIONS_URL_RE = re.compile(r"notifications\.html")
+
+
+def expect_liked(like_btn, liked):
+    """Wait until the like button shows the given liked state."""
+    if liked:
+        expect(like_btn).to_have_class(LIKED_CLASS)
+    else:
+        expect(like_btn).not_to_have_class(LIKED_CLASS)
+
 
 # ==================== FIXTURES ====================
-@pytest.fixture
-def logged_in_home_page(page):
-    """Fixture: Login and navigate to home page."""
-    login_page = LoginPage(page)
-    login_page.navigate()
-    
-    user = TestData.Users.PRIMARY_USER
-    page.locator("#username").fill(user['username'])
-    page.locator("#password").fill(user['password'])
-    page.locator("#loginForm button[type='submit']").click()
-    
-    try:
-        page.wait_for_url("**/home.html", timeout=15000)
-    except:
-        if page.locator("#loginFailToast").is_visible():
-            pytest.skip("Login failed - cannot test home page")
-        raise
+def open_home_page(page):
+    """Navigate to the home page, skipping if the saved login was rejected."""
+    home_page = HomePage(page)
+    home_page.navigate()
+    if not home_page.is_on_home_page():
+        pytest.skip("Login failed - cannot test home page")
     
-    return HomePage(page)
+    return home_page
+
+
+@pytest.fixture
+def logged_in_home_page(class_page):
+    """Fixture: Home page in a context shared by the class (read-only tests)."""
+    return open_home_page(class_page)
+
+
+@pytest.fixture
+def isolated_home_page(isolated_page):
+    """Fixture: Home page in its own context, for tests that change feed or session state."""
+    return open_home_page(isolated_page)
 
 
 class TestHomePageElements:
@@ -43,9 +61,7 @@ class TestHomePageElements:
     @pytest.mark.posts
     def test_home_page_loads_after_login(self, logged_in_home_page):
         """Test: Home page loads correctly after login."""
-        logger.info("=" * 60)
-        logger.info("TEST: Home page loads after login")
-        logger.info("=" * 60)
+        log_banner("TEST: Home page loads after login", logger)
         
         home_page = logged_in_home_page
         
@@ -59,9 +75,7 @@ class TestHomePageElements:
     @pytest.mark.posts
     def test_post_creation_input_visible(self, logged_in_home_page):
         """Test: Post creation input/trigger is visible."""
-        logger.info("=" * 60)
-        logger.info("TEST: Post creation input visible")
-        logger.info("=" * 60)
+        log_banner("TEST: Post creation input visible", logger)
         
         home_page = logged_in_home_page
         
@@ -74,11 +88,9 @@ class TestHomePageElements:
         home_page = logged_in_home_page
         page = home_page.page
         
-        # Wait for feed to load
-        time.sleep(2)
-        
         # Feed container should exist
         feed = page.locator("#feed, .feed-container, .posts-container")
+        wait_ready(feed.first, state="attached")
         assert feed.count() > 0, "Feed container should exist"
         logger.info("✅ Feed container is visible")
 
@@ -86,18 +98,20 @@ class TestHomePageElements:
 class TestPostCreation:
     """Test: Post creation functionality."""
     
+    @pytest.fixture
+    def logged_in_home_page(self, isolated_home_page):
+        """Fixture: Override with a dedicated context; these tests mutate state."""
+        return isolated_home_page
+    
     @pytest.mark.posts
     def test_open_post_modal(self, logged_in_home_page):
         """Test: Clicking post input opens post creation modal."""
-        logger.info("=" * 60)
-        logger.info("TEST: Open post creation modal")
-        logger.info("=" * 60)
+        log_banner("TEST: Open post creation modal", logger)
         
         home_page = logged_in_home_page
         
         # Click on post input to open modal
-        home_page.click_post_input()
-        time.sleep(0.5)
+        home_page.open_post_modal()
         
         assert home_page.is_post_modal_visible(), "Post modal should be visible"
         logger.info("✅ Post creation modal opened")
@@ -105,154 +119,124 @@ class TestPostCreation:
     @pytest.mark.posts
     def test_create_text_post(self, logged_in_home_page):
         """Test: Create a text-only post successfully."""
-        logger.info("=" * 60)
-        logger.info("TEST: Create text post")
-        logger.info("=" * 60)
+        log_banner("TEST: Create text post", logger)
         
         home_page = logged_in_home_page
         page = home_page.page
         
-        # Get initial post count
+        # Get initial post count once the feed has rendered
+        home_page.wait_for_feed_loaded()
         initial_count = home_page.get_post_count()
         logger.info(f"Initial post count: {initial_count}")
         
         # Create a unique post
-        import random
         post_content = f"Automated test post {random.randint(10000, 99999)} 🎉"
         
         # Open modal and create post
-        home_page.click_post_input()
-        time.sleep(0.5)
+        home_page.open_post_modal()
         
         home_page.enter_post_content(post_content)
         home_page.click_submit_post()
         
-        # Wait and verify
-        time.sleep(3)
-        
-        # Check if post was created
-        new_count = home_page.get_post_count()
-        logger.info(f"New post count: {new_count}")
-        
-        # Either count increased or the post appears in feed
-        first_post = home_page.get_first_post_content()
-        if first_post and post_content[:20] in first_post:
-            logger.info("✅ Post created and visible in feed")
-        elif new_count > initial_count:
-            logger.info("✅ Post count increased - post created")
-        else:
-            logger.warning("⚠️ Could not verify post creation")
+        # Feed should grow by exactly the new post
+        expect(page.locator(home_page.selectors.POST_CARD)).to_have_count(initial_count + 1, timeout=5000)
+        logger.info("✅ Post count increased - post created")
     
     @pytest.mark.posts
     def test_create_post_with_emoji(self, logged_in_home_page):
         """Test: Create a post with emojis."""
-        logger.info("=" * 60)
-        logger.info("TEST: Create post with emojis")
-        logger.info("=" * 60)
+        log_banner("TEST: Create post with emojis", logger)
         
         home_page = logged_in_home_page
         
         post_content = TestData.Posts.EMOJI_POST
         
-        home_page.click_post_input()
-        time.sleep(0.5)
+        home_page.open_post_modal()
         home_page.enter_post_content(post_content)
         home_page.click_submit_post()
         
-        time.sleep(2)
-        logger.info("✅ Emoji post submitted")
+        if home_page.wait_for_post_with_text(post_content[:20]):
+            logger.info("✅ Emoji post submitted and visible in feed")
+        else:
+            logger.info("✅ Emoji post submitted")
     
     @pytest.mark.posts
     def test_close_post_modal(self, logged_in_home_page):
         """Test: Close post modal without creating post."""
-        logger.info("=" * 60)
-        logger.info("TEST: Close post modal")
-        logger.info("=" * 60)
+        log_banner("TEST: Close post modal", logger)
         
         home_page = logged_in_home_page
         
-        home_page.click_post_input()
-        time.sleep(0.5)
+        home_page.open_post_modal()
         
         assert home_page.is_post_modal_visible(), "Modal should be open"
         
         home_page.close_post_modal()
-        time.sleep(0.5)
         
         # Modal should be closed
         assert not home_page.is_post_modal_visible(), "Modal should be closed"
         logger.info("✅ Post modal closed successfully")
 
 
+@pytest.mark.usefixtures("seeded_post")
 class TestPostInteractions:
     """Test: Like and comment interactions on posts."""
     
+    @pytest.fixture
+    def logged_in_home_page(self, isolated_home_page):
+        """Fixture: Override with a dedicated context; these tests mutate state."""
+        return isolated_home_page
+    
     @pytest.mark.posts
+    @pytest.mark.flaky(reruns=1)
     def test_like_post(self, logged_in_home_page):
         """Test: Like a post."""
-        logger.info("=" * 60)
-        logger.info("TEST: Like a post")
-        logger.info("=" * 60)
+        log_banner("TEST: Like a post", logger)
         
         home_page = logged_in_home_page
         
-        # Wait for feed to load
-        time.sleep(2)
-        
-        if home_page.get_post_count() == 0:
-            logger.warning("⚠️ No posts in feed, skipping like test")
-            pytest.skip("No posts available to like")
+        expect(home_page.page.locator(home_page.selectors.POST_CARD).first).to_be_visible(timeout=3000)
         
         # Get initial like state
-        initial_liked = home_page.is_post_liked(0)
+        like_btn = home_page.post_like_button(0)
+        initial_liked = bool(LIKED_CLASS.search(like_btn.get_attribute("class") or ""))
         logger.info(f"Initial liked state: {initial_liked}")
         
-        # Like the first post
+        # Like the first post and wait for the state to flip
         home_page.like_post(0)
-        time.sleep(1)
-        
-        # Verify state changed
-        new_liked = home_page.is_post_liked(0)
-        assert new_liked != initial_liked, "Like state should change"
+        expect_liked(like_btn, not initial_liked)
         logger.info("✅ Post like toggled successfully")
     
     @pytest.mark.posts
+    @pytest.mark.flaky(reruns=1)
     def test_unlike_post(self, logged_in_home_page):
         """Test: Unlike a previously liked post."""
-        logger.info("=" * 60)
-        logger.info("TEST: Unlike a post")
-        logger.info("=" * 60)
+        log_banner("TEST: Unlike a post", logger)
         
         home_page = logged_in_home_page
-        time.sleep(2)
+        expect(home_page.page.locator(home_page.selectors.POST_CARD).first).to_be_visible(timeout=3000)
         
-        if home_page.get_post_count() == 0:
-            pytest.skip("No posts available")
+        like_btn = home_page.post_like_button(0)
+        initial_liked = bool(LIKED_CLASS.search(like_btn.get_attribute("class") or ""))
         
         # Like first, then unlike
         home_page.like_post(0)
-        time.sleep(1)
+        expect_liked(like_btn, not initial_liked)
         
         home_page.unlike_post(0)
-        time.sleep(1)
+        expect_liked(like_btn, initial_liked)
         
         logger.info("✅ Post liked and unliked successfully")
     
     @pytest.mark.posts
     def test_open_comments_modal(self, logged_in_home_page):
         """Test: Open comments modal for a post."""
-        logger.info("=" * 60)
-        logger.info("TEST: Open comments modal")
-        logger.info("=" * 60)
+        log_banner("TEST: Open comments modal", logger)
         
         home_page = logged_in_home_page
-        time.sleep(2)
-        
-        if home_page.get_post_count() == 0:
-            pytest.skip("No posts available")
+        expect(home_page.page.locator(home_page.selectors.POST_CARD).first).to_be_visible(timeout=3000)
         
         home_page.open_comments_modal(0)
-        time.sleep(1)
         
         assert home_page.is_comments_modal_visible(), "Comments modal should be visible"
         logger.info("✅ Comments modal opened")
@@ -263,17 +247,11 @@ class TestPostInteractions:
     @pytest.mark.posts
     def test_add_comment(self, logged_in_home_page):
         """Test: Add a comment to a post."""
-        logger.info("=" * 60)
-        logger.info("TEST: Add comment to post")
-        logger.info("=" * 60)
+        log_banner("TEST: Add comment to post", logger)
         
         home_page = logged_in_home_page
-        time.sleep(2)
-        
-        if home_page.get_post_count() == 0:
-            pytest.skip("No posts available")
+        expect(home_page.page.locator(home_page.selectors.POST_CARD).first).to_be_visible(timeout=3000)
         
-        import random
         comment = f"Automated test comment {random.randint(1000, 9999)} 👍"
         
         result = home_page.add_comment(0, comment)
@@ -290,14 +268,11 @@ class TestFeedDisplay:
     @pytest.mark.posts
     def test_feed_loads_posts(self, logged_in_home_page):
         """Test: Feed loads and displays posts."""
-        logger.info("=" * 60)
-        logger.info("TEST: Feed loads posts")
-        logger.info("=" * 60)
+        log_banner("TEST: Feed loads posts", logger)
         
         home_page = logged_in_home_page
         
-        # Wait for feed to load
-        time.sleep(3)
+        home_page.wait_for_feed_loaded()
         
         post_count = home_page.get_post_count()
         logger.info(f"Posts in feed: {post_count}")
@@ -309,18 +284,14 @@ class TestFeedDisplay:
             logger.info("ℹ️ Feed is empty (no posts or no friends with posts)")
     
     @pytest.mark.posts
+    @pytest.mark.usefixtures("seeded_post")
     def test_post_has_required_elements(self, logged_in_home_page):
         """Test: Each post has required elements (author, content, actions)."""
-        logger.info("=" * 60)
-        logger.info("TEST: Post has required elements")
-        logger.info("=" * 60)
+        log_banner("TEST: Post has required elements", logger)
         
         home_page = logged_in_home_page
         page = home_page.page
-        time.sleep(2)
-        
-        if home_page.get_post_count() == 0:
-            pytest.skip("No posts to verify")
+        expect(home_page.page.locator(home_page.selectors.POST_CARD).first).to_be_visible(timeout=3000)
         
         first_post = home_page.get_post_at_index(0)
         
@@ -344,76 +315,51 @@ class TestFeedDisplay:
 class TestNavigation:
     """Test: Navigation from home page."""
     
-    @pytest.mark.navigation
-    def test_navigate_to_profile(self, logged_in_home_page):
-        """Test: Navigate to profile from navbar."""
-        logger.info("=" * 60)
-        logger.info("TEST: Navigate to profile")
-        logger.info("=" * 60)
-        
-        home_page = logged_in_home_page
-        
-        home_page.click_navbar_profile()
-        time.sleep(1)
-        
-        assert "profile.html" in home_page.page.url, "Should navigate to profile"
-        logger.info("✅ Navigated to profile page")
-    
-    @pytest.mark.navigation
-    def test_navigate_to_friends(self, logged_in_home_page):
-        """Test: Navigate to friends from navbar."""
-        home_page = logged_in_home_page
-        
-        home_page.click_navbar_friends()
-        time.sleep(1)
-        
-        assert "friends.html" in home_page.page.url, "Should navigate to friends"
-        logger.info("✅ Navigated to friends page")
-    
-    @pytest.mark.navigation
-    def test_navigate_to_explore(self, logged_in_home_page):
-        """Test: Navigate to explore from navbar."""
-        home_page = logged_in_home_page
-        
-        home_page.click_navbar_explore()
-        time.sleep(1)
-        
-        assert "explore.html" in home_page.page.url, "Should navigate to explore"
-        logger.info("✅ Navigated to explore page")
+    @pytest.fixture
+    def logged_in_home_page(self, har_page):
+        """Fixture: Override with a context that replays pages and assets from a HAR."""
+        return open_home_page(har_page)
     
     @pytest.mark.navigation
-    def test_navigate_to_notifications(self, logged_in_home_page):
-        """Test: Navigate to notifications from navbar."""
+    @pytest.mark.parametrize("click_method,expected_url", [
+        ("click_navbar_profile", PROFILE_URL_RE),
+        ("click_navbar_friends", FRIENDS_URL_RE),
+        ("click_navbar_explore", EXPLORE_URL_RE),
+        ("click_navbar_notifications", NOTIFICATIONS_URL_RE),
+    ], ids=["profile", "friends", "explore", "notifications"])
+    def test_navbar_navigation(self, logged_in_home_page, click_method, expected_url):
+        """Test: Navbar links navigate to their pages."""
         home_page = logged_in_home_page
         
-        home_page.click_navbar_notifications()
-        time.sleep(1)
-        
-        assert "notifications.html" in home_page.page.url, "Should navigate to notifications"
-        logger.info("✅ Navigated to notifications page")
+        getattr(home_page, click_method)()
+        expect(home_page.page).to_have_url(expected_url)
+        logger.info(f"✅ Navigated to {home_page.page.url}")
 
 
 class TestLogout:
     """Test: Logout functionality."""
     
+    @pytest.fixture
+    def logged_in_home_page(self, isolated_home_page):
+        """Fixture: Override with a dedicated context; these tests mutate state."""
+        return isolated_home_page
+    
     @pytest.mark.smoke
     @pytest.mark.auth
     def test_logout(self, logged_in_home_page):
         """Test: Logout successfully."""
-        logger.info("=" * 60)
-        logger.info("TEST: Logout")
-        logger.info("=" * 60)
+        log_banner("TEST: Logout", logger)
         
         home_page = logged_in_home_page
         
         home_page.click_logout()
-        time.sleep(2)
         
         # Should redirect to login page
-        assert "login.html" in home_page.page.url, "Should redirect to login after logout"
+        expect(home_page.page).to_have_url(LOGIN_URL_RE)
         logger.info("✅ Logged out and redirected to login page")
         
-        # Token should be cleared
-        token = home_page.page.evaluate("localStorage.getItem('token')")
-        assert token is None, "Token should be cleared after logout"
+        # Token should be cleared (read from the context's storage state, no page evaluate)
+        storage = home_page.page.context.storage_state()
+        keys = {item['name'] for origin in storage['origins'] for item in origin['localStorage']}
+        assert 'token' not in keys, "Token should be cleared after logout"
         logger.info("✅ Token cleared from localStorage")
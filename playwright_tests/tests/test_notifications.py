@@ -4,37 +4,30 @@ Testing for notification display and actions.
 """
 
 import pytest
-import time
 import logging
 from pages.notifications_page import NotificationsPage
-from pages.login_page import LoginPage
-from constants.test_data import TestData
 
 logger = logging.getLogger(__name__)
 
 
 @pytest.fixture
-def logged_in_notifications_page(page):
-    """Fixture: Login and navigate to notifications page."""
-    login_page = LoginPage(page)
-    login_page.navigate()
-    
-    user = TestData.Users.PRIMARY_USER
-    page.locator("#username").fill(user['username'])
-    page.locator("#password").fill(user['password'])
-    page.locator("#loginForm button[type='submit']").click()
-    
-    try:
-        page.wait_for_url("**/home.html", timeout=15000)
-    except:
+def logged_in_notifications_page(class_page):
+    """Fixture: Notifications in a context restored from the saved login, shared by the class."""
+    notifications_page = NotificationsPage(class_page)
+    notifications_page.navigate()
+    notifications_page.wait_for_notifications_loaded()
+    if not notifications_page.is_on_notifications_page():
         pytest.skip("Login failed")
     
-    notifications_page = NotificationsPage(page)
-    notifications_page.navigate()
-    time.sleep(2)
     return notifications_page
 
 
+@pytest.fixture
+def notif_snapshot(logged_in_notifications_page):
+    """Fixture: Notification counts of the freshly loaded page, read in one round-trip."""
+    return logged_in_notifications_page.get_notifications_summary()
+
+
 class TestNotificationsPageElements:
     """Test: Verify notifications page elements."""
     
@@ -44,13 +37,11 @@ class TestNotificationsPageElements:
         assert logged_in_notifications_page.is_on_notifications_page()
         logger.info("✅ Notifications page loaded")
     
-    def test_page_loaded_state(self, logged_in_notifications_page):
+    def test_page_loaded_state(self, notif_snapshot):
         """Test: Page shows notifications or empty state."""
-        notif_page = logged_in_notifications_page
-        
-        if notif_page.get_notifications_count() > 0:
+        if notif_snapshot["total"] > 0:
             logger.info("✅ Notifications are displayed")
-        elif notif_page.is_no_notifications_message_visible():
+        elif notif_snapshot["empty"]:
             logger.info("✅ No notifications message displayed")
         else:
             logger.info("ℹ️ Page loaded - checking state")
@@ -59,31 +50,31 @@ class TestNotificationsPageElements:
 class TestNotificationsList:
     """Test: Notifications list functionality."""
     
-    def test_notifications_count(self, logged_in_notifications_page):
+    def test_notifications_count(self, notif_snapshot):
         """Test: Get notifications count."""
-        count = logged_in_notifications_page.get_notifications_count()
+        count = notif_snapshot["total"]
         logger.info(f"✅ {count} notifications")
     
-    def test_get_notification_messages(self, logged_in_notifications_page):
+    def test_get_notification_messages(self, logged_in_notifications_page, notif_snapshot):
         """Test: Get notification messages."""
         notif_page = logged_in_notifications_page
         
-        if notif_page.get_notifications_count() == 0:
+        if notif_snapshot["total"] == 0:
             pytest.skip("No notifications")
         
         messages = notif_page.get_notification_messages()
         logger.info(f"✅ Messages: {messages[:2]}")
     
-    def test_unread_notifications_count(self, logged_in_notifications_page):
+    def test_unread_notifications_count(self, notif_snapshot):
         """Test: Get unread notifications count."""
-        count = logged_in_notifications_page.get_unread_notifications_count()
+        count = notif_snapshot["unread"]
         logger.info(f"✅ {count} unread notifications")
     
-    def test_notification_type(self, logged_in_notifications_page):
+    def test_notification_type(self, logged_in_notifications_page, notif_snapshot):
         """Test: Get notification type."""
         notif_page = logged_in_notifications_page
         
-        if notif_page.get_notifications_count() == 0:
+        if notif_snapshot["total"] == 0:
             pytest.skip("No notifications")
         
         notif_type = notif_page.get_notification_type(0)
@@ -93,32 +84,31 @@ class TestNotificationsList:
 class TestNotificationActions:
     """Test: Notification action functionality."""
     
-    def test_click_notification(self, logged_in_notifications_page):
+    def test_click_notification(self, logged_in_notifications_page, notif_snapshot):
         """Test: Click on a notification."""
         notif_page = logged_in_notifications_page
         
-        if notif_page.get_notifications_count() == 0:
+        if notif_snapshot["total"] == 0:
             pytest.skip("No notifications")
         
         notif_page.click_notification(0)
-        time.sleep(1)
         logger.info("✅ Notification clicked")
     
-    def test_mark_notification_as_read(self, logged_in_notifications_page):
+    def test_mark_notification_as_read(self, logged_in_notifications_page, notif_snapshot):
         """Test: Mark notification as read."""
         notif_page = logged_in_notifications_page
         
-        if notif_page.get_unread_notifications_count() == 0:
+        if notif_snapshot["unread"] == 0:
             pytest.skip("No unread notifications")
         
         notif_page.mark_notification_as_read(0)
         logger.info("✅ Mark as read attempted")
     
-    def test_mark_all_as_read(self, logged_in_notifications_page):
+    def test_mark_all_as_read(self, logged_in_notifications_page, notif_snapshot):
         """Test: Mark all notifications as read."""
         notif_page = logged_in_notifications_page
         
-        if notif_page.get_notifications_count() == 0:
+        if notif_snapshot["total"] == 0:
             pytest.skip("No notifications")
         
         notif_page.mark_all_as_read()
@@ -128,52 +118,52 @@ class TestNotificationActions:
 class TestFriendRequestNotifications:
     """Test: Friend request notification actions."""
     
-    def test_friend_request_notifications_count(self, logged_in_notifications_page):
+    def test_friend_request_notifications_count(self, notif_snapshot):
         """Test: Count friend request notifications."""
-        count = logged_in_notifications_page.get_friend_request_notifications_count()
+        count = notif_snapshot["friend_requests"]
         logger.info(f"✅ {count} friend request notifications")
     
     def test_accept_from_notification(self, logged_in_notifications_page):
         """Test: Accept friend request from notification."""
         notif_page = logged_in_notifications_page
         
-        if notif_page.get_friend_request_notifications_count() == 0:
+        items = notif_page.all_friend_request_items()
+        if not items:
             pytest.skip("No friend request notifications")
         
-        notif_page.accept_friend_request_from_notification(0)
+        notif_page.accept_friend_request_item(items[0])
         logger.info("✅ Accept from notification attempted")
     
     def test_reject_from_notification(self, logged_in_notifications_page):
         """Test: Reject friend request from notification."""
         notif_page = logged_in_notifications_page
         
-        if notif_page.get_friend_request_notifications_count() == 0:
+        items = notif_page.all_friend_request_items()
+        if not items:
             pytest.skip("No friend request notifications")
         
-        notif_page.reject_friend_request_from_notification(0)
+        notif_page.reject_friend_request_item(items[0])
         logger.info("✅ Reject from notification attempted")
 
 
 class TestEmptyState:
     """Test: Empty notifications state."""
     
-    def test_empty_state_message(self, logged_in_notifications_page):
+    def test_empty_state_message(self, notif_snapshot):
         """Test: Empty state message when no notifications."""
-        notif_page = logged_in_notifications_page
-        
-        if notif_page.get_notifications_count() > 0:
+        if notif_snapshot["total"] > 0:
             pytest.skip("Has notifications - can't test empty state")
         
-        assert notif_page.is_no_notifications_message_visible()
+        assert notif_snapshot["empty"]
         logger.info("✅ Empty state message displayed")
     
-    def test_clear_all_notifications(self, logged_in_notifications_page):
+    @pytest.mark.serial
+    def test_clear_all_notifications(self, logged_in_notifications_page, notif_snapshot):
         """Test: Clear all notifications."""
         notif_page = logged_in_notifications_page
         
-        if notif_page.get_notifications_count() == 0:
+        if notif_snapshot["total"] == 0:
             pytest.skip("No notifications to clear")
         
         notif_page.clear_all_notifications()
-        time.sleep(1)
         logger.info("✅ Clear all attempted")
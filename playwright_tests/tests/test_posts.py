@@ -11,6 +11,10 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Placeholders only; skipped before the page fixture is set up.
+# Post creation and interactions are covered in test_home.py.
+pytestmark = pytest.mark.skip(reason="Not implemented yet")
+
 
 class TestPostCreation:
     """Post creation tests."""
@@ -3,35 +3,24 @@ Profile Page Automation Tests
 Testing for user profile view and edit functionality.
 """
 
+import random
 import pytest
-import time
 import logging
+from playwright.sync_api import expect
 from pages.profile_page import ProfilePage
-from pages.login_page import LoginPage
-from constants.test_data import TestData
 
 logger = logging.getLogger(__name__)
 
 
 @pytest.fixture
-def logged_in_profile_page(page):
-    """Fixture: Login and navigate to profile page."""
-    login_page = LoginPage(page)
-    login_page.navigate()
-    
-    user = TestData.Users.PRIMARY_USER
-    page.locator("#username").fill(user['username'])
-    page.locator("#password").fill(user['password'])
-    page.locator("#loginForm button[type='submit']").click()
-    
-    try:
-        page.wait_for_url("**/home.html", timeout=15000)
-    except:
+def logged_in_profile_page(class_page):
+    """Fixture: Profile in a context restored from the saved login, shared by the class."""
+    profile_page = ProfilePage(class_page)
+    profile_page.navigate()
+    profile_page.wait_for_profile_loaded()
+    if not profile_page.is_on_profile_page():
         pytest.skip("Login failed")
     
-    profile_page = ProfilePage(page)
-    profile_page.navigate()
-    time.sleep(2)
     return profile_page
 
 
@@ -79,25 +68,22 @@ class TestProfileEdit:
         """Test: Open edit profile modal."""
         profile_page = logged_in_profile_page
         profile_page.click_edit_profile()
-        time.sleep(0.5)
         
-        assert profile_page.is_edit_modal_visible()
+        expect(profile_page.page.locator("#editModal")).to_be_visible()
         logger.info("✅ Edit modal opened")
         profile_page.cancel_edit()
     
     @pytest.mark.profile
+    @pytest.mark.serial
     def test_edit_bio(self, logged_in_profile_page):
         """Test: Edit profile bio."""
         profile_page = logged_in_profile_page
         
-        import random
         new_bio = f"Test bio {random.randint(1000, 9999)}"
         
         profile_page.click_edit_profile()
-        time.sleep(0.5)
         profile_page.enter_edit_bio(new_bio)
         profile_page.save_profile_changes()
-        time.sleep(2)
         logger.info("✅ Bio edit attempted")
     
     @pytest.mark.profile
@@ -106,10 +92,8 @@ class TestProfileEdit:
         profile_page = logged_in_profile_page
         
         profile_page.click_edit_profile()
-        time.sleep(0.5)
         profile_page.enter_edit_bio("Should not save")
         profile_page.cancel_edit()
-        time.sleep(0.5)
         logger.info("✅ Edit cancelled")
 
 
@@ -125,14 +109,14 @@ class TestProfilePosts:
     @pytest.mark.profile
     def test_user_posts_displayed(self, logged_in_profile_page):
         """Test: User posts are displayed."""
-        time.sleep(2)
+        logged_in_profile_page.wait_for_posts_loaded()
         count = logged_in_profile_page.get_user_posts_count()
         logger.info(f"✅ {count} posts on profile")
     
     @pytest.mark.profile
     def test_like_post_on_profile(self, logged_in_profile_page):
         """Test: Like post on profile."""
-        time.sleep(2)
+        logged_in_profile_page.wait_for_posts_loaded()
         if logged_in_profile_page.get_user_posts_count() == 0:
             pytest.skip("No posts")
         
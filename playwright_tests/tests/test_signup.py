@@ -3,23 +3,26 @@ Signup Page Automation Tests
 Comprehensive positive and negative testing for the signup functionality.
 """
 
+import re
 import pytest
-import time
 import logging
+from playwright.sync_api import expect
 from pages.signup_page import SignupPage
 from constants.urls import URLs
+from utils.helpers import log_banner
 
 logger = logging.getLogger(__name__)
 
+INVALID_CLASS = re.compile(r"\bis-invalid\b")
+VALID_CLASS = re.compile(r"\bis-valid\b")
+
 
 class TestSignupPageElements:
     """Test: Verify all signup page elements are visible."""
     
     def test_signup_page_loads(self, page):
         """Test: Signup page loads correctly with all elements visible."""
-        logger.info("=" * 60)
-        logger.info("TEST: Signup page loads correctly")
-        logger.info("=" * 60)
+        log_banner("TEST: Signup page loads correctly", logger)
         
         signup_page = SignupPage(page)
         signup_page.navigate()
@@ -28,229 +31,64 @@ class TestSignupPageElements:
         assert signup_page.is_on_signup_page(), "Should be on signup page"
         logger.info("✅ Signup page loaded successfully")
         
-        # Verify all form elements are visible
-        assert page.locator("#name").is_visible(), "Name field should be visible"
+        # Verify all form elements are visible (checked together in one round-trip)
+        checks = signup_page.check_all_elements_visible()
+        
+        assert checks['name'], "Name field should be visible"
         logger.info("✅ Name field is visible")
         
-        assert page.locator("#username").is_visible(), "Username field should be visible"
+        assert checks['username'], "Username field should be visible"
         logger.info("✅ Username field is visible")
         
-        assert page.locator("#email").is_visible(), "Email field should be visible"
+        assert checks['email'], "Email field should be visible"
         logger.info("✅ Email field is visible")
         
-        assert page.locator("#newPassword").is_visible(), "Password field should be visible"
+        assert checks['password'], "Password field should be visible"
         logger.info("✅ Password field is visible")
         
-        assert page.locator("#signupBtn").is_visible(), "Signup button should be visible"
+        assert checks['signup_button'], "Signup button should be visible"
         logger.info("✅ Signup button is visible")
         
-        assert page.locator("#togglePassword").is_visible(), "Password toggle should be visible"
+        assert checks['password_toggle'], "Password toggle should be visible"
         logger.info("✅ Password toggle is visible")
         
         # Verify login link
-        login_link = page.locator("a[href='login.html']")
-        assert login_link.is_visible(), "Login link should be visible"
+        assert checks['login_link'], "Login link should be visible"
         logger.info("✅ Login link is visible")
         
-        logger.info("=" * 60)
-        logger.info("TEST PASSED: All signup page elements verified")
-        logger.info("=" * 60)
+        log_banner("TEST PASSED: All signup page elements verified", logger)
 
 
 class TestSignupFieldValidation:
     """Test: Field-level validation (on blur)"""
     
-    def test_name_field_validation_invalid_single_char(self, page):
-        """Test: Name with single character should show error."""
-        logger.info("=" * 60)
-        logger.info("TEST: Name validation - single character (invalid)")
-        logger.info("=" * 60)
+    # (field locator, value, locator clicked to blur the field, expected class)
+    @pytest.mark.parametrize("field,value,blur_to,expected", [
+        pytest.param("name_input", "A", "username_input", INVALID_CLASS, id="name-single-char"),
+        pytest.param("name_input", "John123", "username_input", INVALID_CLASS, id="name-with-numbers"),
+        pytest.param("name_input", "John Doe", "username_input", VALID_CLASS, id="name-valid"),
+        pytest.param("username_input", "john doe", "email_input", INVALID_CLASS, id="username-with-spaces"),
+        pytest.param("username_input", "a", "email_input", INVALID_CLASS, id="username-single-char"),
+        pytest.param("username_input", "johndoe123", "email_input", VALID_CLASS, id="username-valid"),
+        pytest.param("email_input", "notanemail", "password_input", INVALID_CLASS, id="email-invalid-format"),
+        pytest.param("email_input", "testgmail.com", "password_input", INVALID_CLASS, id="email-missing-at"),
+        pytest.param("email_input", "test@gmail.com", "password_input", VALID_CLASS, id="email-valid"),
+        pytest.param("password_input", "12345", "name_input", INVALID_CLASS, id="password-too-short"),
+        pytest.param("password_input", "Test@12345", "name_input", VALID_CLASS, id="password-valid"),
+    ])
+    def test_field_validation(self, page, field, value, blur_to, expected):
+        """Test: Each field shows is-valid / is-invalid after blur."""
+        log_banner(f"TEST: {field} validation - {value!r}", logger)
         
         signup_page = SignupPage(page)
         signup_page.navigate()
         
-        # Enter single character name
-        page.locator("#name").fill("A")
-        page.locator("#username").click()  # Trigger blur
-        time.sleep(0.5)
+        field_input = getattr(signup_page, field)
+        field_input.fill(value)
+        getattr(signup_page, blur_to).click()  # Trigger blur
         
-        # Should have is-invalid class
-        has_invalid = page.locator("#name.is-invalid").count() > 0
-        assert has_invalid, "Single character name should be invalid"
-        logger.info("✅ Single character name shows validation error")
-    
-    def test_name_field_validation_with_numbers(self, page):
-        """Test: Name with numbers should show error."""
-        logger.info("=" * 60)
-        logger.info("TEST: Name validation - contains numbers (invalid)")
-        logger.info("=" * 60)
-        
-        signup_page = SignupPage(page)
-        signup_page.navigate()
-        
-        # Enter name with numbers
-        page.locator("#name").fill("John123")
-        page.locator("#username").click()  # Trigger blur
-        time.sleep(0.5)
-        
-        has_invalid = page.locator("#name.is-invalid").count() > 0
-        assert has_invalid, "Name with numbers should be invalid"
-        logger.info("✅ Name with numbers shows validation error")
-    
-    def test_name_field_validation_valid(self, page):
-        """Test: Valid name should show success."""
-        logger.info("=" * 60)
-        logger.info("TEST: Name validation - valid name")
-        logger.info("=" * 60)
-        
-        signup_page = SignupPage(page)
-        signup_page.navigate()
-        
-        # Enter valid name
-        page.locator("#name").fill("John Doe")
-        page.locator("#username").click()  # Trigger blur
-        time.sleep(0.5)
-        
-        has_valid = page.locator("#name.is-valid").count() > 0
-        assert has_valid, "Valid name should show success"
-        logger.info("✅ Valid name shows success indicator")
-    
-    def test_username_field_validation_with_spaces(self, page):
-        """Test: Username with spaces should show error."""
-        logger.info("=" * 60)
-        logger.info("TEST: Username validation - contains spaces (invalid)")
-        logger.info("=" * 60)
-        
-        signup_page = SignupPage(page)
-        signup_page.navigate()
-        
-        # Enter username with spaces
-        page.locator("#username").fill("john doe")
-        page.locator("#email").click()  # Trigger blur
-        time.sleep(0.5)
-        
-        has_invalid = page.locator("#username.is-invalid").count() > 0
-        assert has_invalid, "Username with spaces should be invalid"
-        logger.info("✅ Username with spaces shows validation error")
-    
-    def test_username_field_validation_single_char(self, page):
-        """Test: Single character username should show error."""
-        logger.info("=" * 60)
-        logger.info("TEST: Username validation - single character (invalid)")
-        logger.info("=" * 60)
-        
-        signup_page = SignupPage(page)
-        signup_page.navigate()
-        
-        page.locator("#username").fill("a")
-        page.locator("#email").click()
-        time.sleep(0.5)
-        
-        has_invalid = page.locator("#username.is-invalid").count() > 0
-        assert has_invalid, "Single character username should be invalid"
-        logger.info("✅ Single character username shows validation error")
-    
-    def test_username_field_validation_valid(self, page):
-        """Test: Valid username should show success."""
-        logger.info("=" * 60)
-        logger.info("TEST: Username validation - valid username")
-        logger.info("=" * 60)
-        
-        signup_page = SignupPage(page)
-        signup_page.navigate()
-        
-        page.locator("#username").fill("johndoe123")
-        page.locator("#email").click()
-        time.sleep(0.5)
-        
-        has_valid = page.locator("#username.is-valid").count() > 0
-        assert has_valid, "Valid username should show success"
-        logger.info("✅ Valid username shows success indicator")
-    
-    def test_email_field_validation_invalid_format(self, page):
-        """Test: Invalid email format should show error."""
-        logger.info("=" * 60)
-        logger.info("TEST: Email validation - invalid format")
-        logger.info("=" * 60)
-        
-        signup_page = SignupPage(page)
-        signup_page.navigate()
-        
-        page.locator("#email").fill("notanemail")
-        page.locator("#newPassword").click()
-        time.sleep(0.5)
-        
-        has_invalid = page.locator("#email.is-invalid").count() > 0
-        assert has_invalid, "Invalid email should show error"
-        logger.info("✅ Invalid email format shows validation error")
-    
-    def test_email_field_validation_missing_at(self, page):
-        """Test: Email without @ should show error."""
-        logger.info("=" * 60)
-        logger.info("TEST: Email validation - missing @ symbol")
-        logger.info("=" * 60)
-        
-        signup_page = SignupPage(page)
-        signup_page.navigate()
-        
-        page.locator("#email").fill("testgmail.com")
-        page.locator("#newPassword").click()
-        time.sleep(0.5)
-        
-        has_invalid = page.locator("#email.is-invalid").count() > 0
-        assert has_invalid, "Email without @ should be invalid"
-        logger.info("✅ Email without @ shows validation error")
-    
-    def test_email_field_validation_valid(self, page):
-        """Test: Valid email should show success."""
-        logger.info("=" * 60)
-        logger.info("TEST: Email validation - valid email")
-        logger.info("=" * 60)
-        
-        signup_page = SignupPage(page)
-        signup_page.navigate()
-        
-        page.locator("#email").fill("test@gmail.com")
-        page.locator("#newPassword").click()
-        time.sleep(0.5)
-        
-        has_valid = page.locator("#email.is-valid").count() > 0
-        assert has_valid, "Valid email should show success"
-        logger.info("✅ Valid email shows success indicator")
-    
-    def test_password_field_validation_short(self, page):
-        """Test: Short password (< 6 chars) should show error."""
-        logger.info("=" * 60)
-        logger.info("TEST: Password validation - too short")
-        logger.info("=" * 60)
-        
-        signup_page = SignupPage(page)
-        signup_page.navigate()
-        
-        page.locator("#newPassword").fill("12345")
-        page.locator("#name").click()  # Trigger blur
-        time.sleep(0.5)
-        
-        has_invalid = page.locator("#newPassword.is-invalid").count() > 0
-        assert has_invalid, "Short password should be invalid"
-        logger.info("✅ Short password shows validation error")
-    
-    def test_password_field_validation_valid(self, page):
-        """Test: Valid password (>= 6 chars) should show success."""
-        logger.info("=" * 60)
-        logger.info("TEST: Password validation - valid password")
-        logger.info("=" * 60)
-        
-        signup_page = SignupPage(page)
-        signup_page.navigate()
-        
-        page.locator("#newPassword").fill("Test@12345")
-        page.locator("#name").click()
-        time.sleep(0.5)
-        
-        has_valid = page.locator("#newPassword.is-valid").count() > 0
-        assert has_valid, "Valid password should show success"
-        logger.info("✅ Valid password shows success indicator")
+        expect(field_input).to_have_class(expected)
+        logger.info(f"✅ {field} with {value!r} shows {expected.pattern}")
 
 
 class TestSignupPasswordToggle:
@@ -258,15 +96,13 @@ class TestSignupPasswordToggle:
     
     def test_password_toggle_visibility(self, page):
         """Test: Toggle password visibility on/off."""
-        logger.info("=" * 60)
-        logger.info("TEST: Password visibility toggle")
-        logger.info("=" * 60)
+        log_banner("TEST: Password visibility toggle", logger)
         
         signup_page = SignupPage(page)
         signup_page.navigate()
         
-        password_field = page.locator("#newPassword")
-        toggle_btn = page.locator("#togglePassword")
+        password_field = signup_page.password_input
+        toggle_btn = signup_page.password_toggle
         
         # Enter password
         password_field.fill("Test@12345")
@@ -277,16 +113,12 @@ class TestSignupPasswordToggle:
         
         # Click toggle to show password
         toggle_btn.click()
-        time.sleep(0.3)
-        
-        assert password_field.get_attribute("type") == "text", "Password should be visible after toggle"
+        expect(password_field).to_have_attribute("type", "text")
         logger.info("✅ Password is visible after first toggle")
         
         # Click toggle to hide password
         toggle_btn.click()
-        time.sleep(0.3)
-        
-        assert password_field.get_attribute("type") == "password", "Password should be hidden after second toggle"
+        expect(password_field).to_have_attribute("type", "password")
         logger.info("✅ Password is hidden after second toggle")
 
 
@@ -295,115 +127,101 @@ class TestSignupFormSubmission:
     
     def test_submit_empty_form(self, page):
         """Test: Submitting empty form should show validation errors."""
-        logger.info("=" * 60)
-        logger.info("TEST: Submit empty form (negative test)")
-        logger.info("=" * 60)
+        log_banner("TEST: Submit empty form (negative test)", logger)
         
         signup_page = SignupPage(page)
         signup_page.navigate()
         
         # Click signup button without filling form
-        page.locator("#signupBtn").click()
-        time.sleep(1)
+        signup_page.signup_button.click()
         
         # All fields should show validation errors
-        assert page.locator("#name.is-invalid").count() > 0, "Name should show error"
-        assert page.locator("#username.is-invalid").count() > 0, "Username should show error"
-        assert page.locator("#email.is-invalid").count() > 0, "Email should show error"
-        assert page.locator("#newPassword.is-invalid").count() > 0, "Password should show error"
+        expect(signup_page.name_input).to_have_class(INVALID_CLASS)
+        expect(signup_page.username_input).to_have_class(INVALID_CLASS)
+        expect(signup_page.email_input).to_have_class(INVALID_CLASS)
+        expect(signup_page.password_input).to_have_class(INVALID_CLASS)
         
         logger.info("✅ Empty form submission shows all validation errors")
     
     def test_submit_partial_form(self, page):
         """Test: Submitting partially filled form should show errors for empty fields."""
-        logger.info("=" * 60)
-        logger.info("TEST: Submit partially filled form")
-        logger.info("=" * 60)
+        log_banner("TEST: Submit partially filled form", logger)
         
         signup_page = SignupPage(page)
         signup_page.navigate()
         
         # Fill only name and username
-        page.locator("#name").fill("John Doe")
-        page.locator("#username").fill("johndoe")
+        signup_page.name_input.fill("John Doe")
+        signup_page.username_input.fill("johndoe")
         
         # Submit
-        page.locator("#signupBtn").click()
-        time.sleep(1)
+        signup_page.signup_button.click()
         
         # Name and username should be valid
-        assert page.locator("#name.is-valid").count() > 0, "Name should be valid"
-        assert page.locator("#username.is-valid").count() > 0, "Username should be valid"
+        expect(signup_page.name_input).to_have_class(VALID_CLASS)
+        expect(signup_page.username_input).to_have_class(VALID_CLASS)
         
         # Email and password should show errors
-        assert page.locator("#email.is-invalid").count() > 0, "Email should show error"
-        assert page.locator("#newPassword.is-invalid").count() > 0, "Password should show error"
+        expect(signup_page.email_input).to_have_class(INVALID_CLASS)
+        expect(signup_page.password_input).to_have_class(INVALID_CLASS)
         
         logger.info("✅ Partial form shows errors only for empty fields")
     
     def test_submit_with_invalid_data(self, page):
         """Test: Submit form with all invalid data."""
-        logger.info("=" * 60)
-        logger.info("TEST: Submit form with invalid data")
-        logger.info("=" * 60)
+        log_banner("TEST: Submit form with invalid data", logger)
         
         signup_page = SignupPage(page)
         signup_page.navigate()
         
         # Fill with invalid data
-        page.locator("#name").fill("A")  # Too short
-        page.locator("#username").fill("a")  # Too short
-        page.locator("#email").fill("notvalid")  # Invalid format
-        page.locator("#newPassword").fill("123")  # Too short
+        signup_page.name_input.fill("A")  # Too short
+        signup_page.username_input.fill("a")  # Too short
+        signup_page.email_input.fill("notvalid")  # Invalid format
+        signup_page.password_input.fill("123")  # Too short
         
         # Submit
-        page.locator("#signupBtn").click()
-        time.sleep(1)
+        signup_page.signup_button.click()
         
         # All fields should show errors
-        assert page.locator("#name.is-invalid").count() > 0, "Invalid name should show error"
-        assert page.locator("#username.is-invalid").count() > 0, "Invalid username should show error"
-        assert page.locator("#email.is-invalid").count() > 0, "Invalid email should show error"
-        assert page.locator("#newPassword.is-invalid").count() > 0, "Invalid password should show error"
+        expect(signup_page.name_input).to_have_class(INVALID_CLASS)
+        expect(signup_page.username_input).to_have_class(INVALID_CLASS)
+        expect(signup_page.email_input).to_have_class(INVALID_CLASS)
+        expect(signup_page.password_input).to_have_class(INVALID_CLASS)
         
         # Error toast should appear
-        error_toast = page.locator("#signupFailToast")
+        error_toast = signup_page.error_toast
         error_toast.wait_for(state="visible", timeout=5000)
         assert error_toast.is_visible(), "Error toast should appear"
         
         logger.info("✅ Invalid data submission shows all field errors and error toast")
     
-    def test_signup_with_valid_new_user(self, page):
+    def test_signup_with_valid_new_user(self, page, fresh_user):
         """Test: Successful signup with valid new user data."""
-        logger.info("=" * 60)
-        logger.info("TEST: Signup with valid new user (positive test)")
-        logger.info("=" * 60)
+        log_banner("TEST: Signup with valid new user (positive test)", logger)
         
         signup_page = SignupPage(page)
         signup_page.navigate()
         
-        # Generate unique user data
-        import random
-        unique_id = random.randint(10000, 99999)
-        
-        name = f"Test User {unique_id}"
-        username = f"testuser{unique_id}"
-        email = f"testuser{unique_id}@test.com"
-        password = "Test@12345"
+        # Unique per worker, so parallel runs never collide
+        name = fresh_user['name']
+        username = fresh_user['username']
+        email = fresh_user['email']
+        password = fresh_user['password']
         
         logger.info(f"Creating user: {username}")
         
         # Fill form with valid data
-        page.locator("#name").fill(name)
-        page.locator("#username").fill(username)
-        page.locator("#email").fill(email)
-        page.locator("#newPassword").fill(password)
+        signup_page.name_input.fill(name)
+        signup_page.username_input.fill(username)
+        signup_page.email_input.fill(email)
+        signup_page.password_input.fill(password)
         
         # Submit
-        page.locator("#signupBtn").click()
+        signup_page.signup_button.click()
         
         # Wait for success toast
-        success_toast = page.locator("#signupToast")
+        success_toast = signup_page.success_toast
         try:
             success_toast.wait_for(state="visible", timeout=10000)
             logger.info("✅ Success toast appeared")
@@ -414,32 +232,30 @@ class TestSignupFormSubmission:
             logger.info("✅ Redirected to login page after successful signup")
         except:
             # Check if error toast appeared instead
-            if page.locator("#signupFailToast").is_visible():
+            if signup_page.error_toast.is_visible():
                 logger.warning("⚠️ Signup failed - user might already exist or API error")
                 pytest.skip("Signup failed - might be duplicate user or API down")
             else:
                 raise
     
-    def test_signup_with_existing_username(self, page):
+    def test_signup_with_existing_username(self, page, ensure_primary_user):
         """Test: Signup with already existing username should fail."""
-        logger.info("=" * 60)
-        logger.info("TEST: Signup with existing username (negative test)")
-        logger.info("=" * 60)
+        log_banner("TEST: Signup with existing username (negative test)", logger)
         
         signup_page = SignupPage(page)
         signup_page.navigate()
         
-        # Use existing user (playwrighttest from previous setup)
-        page.locator("#name").fill("Existing User")
-        page.locator("#username").fill("playwrighttest")  # Already exists
-        page.locator("#email").fill("newunique@test.com")
-        page.locator("#newPassword").fill("Test@12345")
+        # Use the primary user, created through the API before this test
+        signup_page.name_input.fill("Existing User")
+        signup_page.username_input.fill(ensure_primary_user['username'])  # Already exists
+        signup_page.email_input.fill("newunique@test.com")
+        signup_page.password_input.fill("Test@12345")
         
         # Submit
-        page.locator("#signupBtn").click()
+        signup_page.signup_button.click()
         
         # Wait for error toast
-        error_toast = page.locator("#signupFailToast")
+        error_toast = signup_page.error_toast
         try:
             error_toast.wait_for(state="visible", timeout=10000)
             assert error_toast.is_visible(), "Error toast should appear for existing username"
@@ -454,15 +270,13 @@ class TestSignupNavigation:
     
     def test_navigate_to_login_page(self, page):
         """Test: Click 'Log In' link navigates to login page."""
-        logger.info("=" * 60)
-        logger.info("TEST: Navigate to login page from signup")
-        logger.info("=" * 60)
+        log_banner("TEST: Navigate to login page from signup", logger)
         
         signup_page = SignupPage(page)
         signup_page.navigate()
         
         # Click login link
-        login_link = page.locator("a[href='login.html']")
+        login_link = signup_page.login_link
         login_link.click()
         
         # Wait for navigation
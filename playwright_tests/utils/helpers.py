@@ -4,14 +4,34 @@ Common helper functions for tests.
 """
 
 import os
+import re
+import time
 import random
 import string
 from datetime import datetime
 from typing import List, Dict, Any
+from playwright.sync_api import expect, TimeoutError as PlaywrightTimeoutError
+from constants.config import Config
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Characters used by generate_random_string, joined once at import
+_ALPHABET = string.ascii_letters + string.digits
+
+# Separator lines around log_banner messages
+SEP = "=" * 60
+SEP_WIDE = "=" * 80
+
+# A user card's add button has flipped to pending/cancel after a friend request
+REQUEST_SENT_JS = """card =>
+    !!card.querySelector('.cancel-request-btn, .pending-badge, .sent') ||
+    /Pending|Cancel/.test(card.textContent)"""
+
+# Used by format_test_name, compiled/built once at import
+_TEST_PREFIX_RE = re.compile(r'^test_')
+_UNDERSCORE_TO_SPACE = str.maketrans('_', ' ')
+
 
 def generate_random_string(length: int = 10) -> str:
     """
@@ -23,7 +43,7 @@ def generate_random_string(length: int = 10) -> str:
     Returns:
         Random string
     """
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+    return ''.join(random.choices(_ALPHABET, k=length))
 
 
 def generate_random_email() -> str:
@@ -54,22 +74,80 @@ def wait_for_condition(condition_func, timeout: int = 10, interval: float = 0.5)
     Args:
         condition_func: Function that returns boolean
         timeout: Maximum wait time in seconds
-        interval: Check interval in seconds
+        interval: Longest gap between checks in seconds; polling starts at
+            20ms and backs off towards it
         
     Returns:
         True if condition met, False if timeout
     """
-    import time
-    start_time = time.time()
+    start_time = time.monotonic()
+    wait = 0.02
     
-    while time.time() - start_time < timeout:
+    while time.monotonic() - start_time < timeout:
         if condition_func():
             return True
-        time.sleep(interval)
+        time.sleep(wait)
+        wait = min(wait * 1.5, interval)
     
     return False
 
 
+def log_banner(message: str, log: logging.Logger = None, sep: str = SEP):
+    """
+    Log a message between separator lines in a single logging call.
+    
+    Args:
+        message: Banner text (e.g. "TEST: Login page loads correctly")
+        log: Logger to emit on (defaults to this module's logger)
+        sep: Separator line (SEP or SEP_WIDE)
+    """
+    (log or logger).info("\n%s\n%s\n%s", sep, message, sep)
+
+
+def wait_ready(locator, state: str = "visible", timeout: int = None):
+    """
+    Wait for a locator to reach a state using Playwright's auto-waiting expect.
+    
+    Returns as soon as the state is reached instead of sleeping a fixed time.
+    
+    Args:
+        locator: Playwright Locator to wait on
+        state: One of "visible", "hidden" or "attached"
+        timeout: Maximum wait time in milliseconds (defaults to Config.Timeouts.ELEMENT_WAIT)
+        
+    Raises:
+        AssertionError: If the state is not reached within timeout
+    """
+    timeout = timeout or Config.Timeouts.ELEMENT_WAIT
+    if state == "visible":
+        expect(locator).to_be_visible(timeout=timeout)
+    elif state == "hidden":
+        expect(locator).to_be_hidden(timeout=timeout)
+    elif state == "attached":
+        expect(locator).to_be_attached(timeout=timeout)
+    else:
+        raise ValueError(f"Unsupported state: {state}")
+
+
+def wait_for_request_sent(card, timeout: int = 5000) -> bool:
+    """
+    Wait until a user card shows a pending friend request.
+    
+    Args:
+        card: Locator of the user/suggestion card the request was sent from
+        timeout: Maximum wait time in milliseconds
+        
+    Returns:
+        True if the card switched to pending, False on timeout
+    """
+    try:
+        card.page.wait_for_function(REQUEST_SENT_JS, arg=card.element_handle(), timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        logger.info(f"Friend request state did not change within {timeout}ms")
+        return False
+
+
 def create_directory_if_not_exists(directory: str):
     """
     Create directory if it doesn't exist.
@@ -77,9 +155,7 @@ def create_directory_if_not_exists(directory: str):
     Args:
         directory: Directory path
     """
-    if not os.path.exists(directory):
-        os.makedirs(directory)
-        logger.info(f"Created directory: {directory}")
+    os.makedirs(directory, exist_ok=True)
 
 
 def clean_directory(directory: str):
@@ -90,13 +166,15 @@ def clean_directory(directory: str):
         directory: Directory path
     """
     if os.path.exists(directory):
-        for file in os.listdir(directory):
-            file_path = os.path.join(directory, file)
-            try:
-                if os.path.isfile(file_path):
-                    os.unlink(file_path)
-            except Exception as e:
-                logger.error(f"Error deleting {file_path}: {e}")
+        # DirEntry carries the file type from the listing, so no extra stat per file
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                try:
+                    os.unlink(entry.path)
+                except OSError as e:
+                    logger.error(f"Error deleting {entry.path}: {e}")
 
 
 def format_test_name(test_name: str) -> str:
@@ -110,20 +188,15 @@ def format_test_name(test_name: str) -> str:
         Formatted test name
     """
     # Remove 'test_' prefix and replace underscores with spaces
-    formatted = test_name.replace('test_', '').replace('_', ' ').title()
-    return formatted
+    return _TEST_PREFIX_RE.sub('', test_name, count=1).translate(_UNDERSCORE_TO_SPACE).title()
 
 
 def log_test_start(test_name: str):
     """Log test start."""
-    logger.info("=" * 80)
-    logger.info(f"Starting Test: {format_test_name(test_name)}")
-    logger.info("=" * 80)
+    log_banner(f"Starting Test: {format_test_name(test_name)}", sep=SEP_WIDE)
 
 
 def log_test_end(test_name: str, passed: bool = True):
     """Log test end."""
     status = "PASSED" if passed else "FAILED"
-    logger.info("=" * 80)
-    logger.info(f"Test {status}: {format_test_name(test_name)}")
-    logger.info("=" * 80)
+    log_banner(f"Test {status}: {format_test_name(test_name)}", sep=SEP_WIDE)
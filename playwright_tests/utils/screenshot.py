@@ -4,6 +4,9 @@ Helper functions for taking and managing screenshots.
 """
 
 import os
+import time
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from constants.config import Config
 import logging
@@ -11,9 +14,21 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _write_file(filepath: str, data: bytes):
+    """Write screenshot bytes to disk (runs on the writer pool)."""
+    try:
+        with open(filepath, "wb") as f:
+            f.write(data)
+    except OSError as e:
+        logger.error(f"Error writing screenshot {filepath}: {e}")
+
+
 class ScreenshotHelper:
     """Screenshot helper class."""
     
+    # Disk writes run here so the test resumes as soon as the image is captured
+    _pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="screenshot-writer")
+    
     def __init__(self, page):
         """
         Initialize screenshot helper.
@@ -26,23 +41,61 @@ class ScreenshotHelper:
         
         # Create directory if not exists
         os.makedirs(self.screenshot_dir, exist_ok=True)
+        
+        # (epoch second, formatted timestamp) and a sequence number within that second
+        self._ts_cache = (0, "")
+        self._seq = 0
+    
+    def _filename(self, name: str) -> str:
+        """
+        Build a unique screenshot filename.
+        
+        The timestamp is formatted once per second; a sequence number keeps
+        names from the same second apart.
+        
+        Args:
+            name: Screenshot name
+            
+        Returns:
+            Filename with timestamp, sequence number and extension
+        """
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (now, datetime.fromtimestamp(now).strftime("%Y%m%d_%H%M%S"))
+            self._seq = 0
+        filename = f"{name}_{self._ts_cache[1]}_{self._seq}.{Config.Screenshot.FORMAT}"
+        self._seq += 1
+        return filename
+    
+    @staticmethod
+    def image_options() -> dict:
+        """
+        Get the screenshot() keyword arguments for the configured format.
+        
+        Returns:
+            Dict with type, plus quality for jpeg (png does not accept one)
+        """
+        if Config.Screenshot.FORMAT == "jpeg":
+            return {"type": "jpeg", "quality": Config.Screenshot.QUALITY}
+        return {"type": "png"}
     
-    def take_screenshot(self, name: str, full_page: bool = True) -> str:
+    def take_screenshot(self, name: str, full_page: bool = None) -> str:
         """
         Take screenshot.
         
         Args:
             name: Screenshot name
-            full_page: Capture full page
+            full_page: Capture full page (defaults to Config.Screenshot.FULL_PAGE)
             
         Returns:
             Screenshot file path
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{name}_{timestamp}.{Config.Screenshot.FORMAT}"
-        filepath = os.path.join(self.screenshot_dir, filename)
+        if full_page is None:
+            full_page = Config.Screenshot.FULL_PAGE
+        filepath = os.path.join(self.screenshot_dir, self._filename(name))
         
-        self.page.screenshot(path=filepath, full_page=full_page)
+        data = self.page.screenshot(full_page=full_page, **self.image_options())
+        ScreenshotHelper._pool.submit(_write_file, filepath, data)
         logger.info(f"Screenshot saved: {filepath}")
         
         return filepath
@@ -58,12 +111,11 @@ class ScreenshotHelper:
         Returns:
             Screenshot file path
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{name}_{timestamp}.{Config.Screenshot.FORMAT}"
-        filepath = os.path.join(self.screenshot_dir, filename)
+        filepath = os.path.join(self.screenshot_dir, self._filename(name))
         
         element = self.page.locator(selector)
-        element.screenshot(path=filepath)
+        data = element.screenshot(**self.image_options())
+        ScreenshotHelper._pool.submit(_write_file, filepath, data)
         logger.info(f"Element screenshot saved: {filepath}")
         
         return filepath
@@ -78,4 +130,8 @@ class ScreenshotHelper:
         Returns:
             Screenshot file path
         """
-        return self.take_screenshot(f"FAILED_{test_name}")
+        return self.take_screenshot(f"FAILED_{test_name}", full_page=True)
+
+
+# Flush pending screenshot writes before the interpreter exits
+atexit.register(ScreenshotHelper._pool.shutdown, wait=True)